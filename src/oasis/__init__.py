@@ -25,6 +25,8 @@ from oasis.api import (
     QueryError,
     # Tabular data
     execute_query,
+    execute_query_arrow,
+    execute_query_iter,
     # Dataset management
     get_active_dataset,
     get_schema,
@@ -40,6 +42,8 @@ __all__ = [
     "QueryError",
     "__version__",
     "execute_query",
+    "execute_query_arrow",
+    "execute_query_iter",
     "get_active_dataset",
     "get_schema",
     "get_table_info",
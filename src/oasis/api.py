@@ -6,6 +6,8 @@ the MCP server, ensuring consistent behavior across interfaces.
 
 Unlike the MCP server, this API returns native Python types:
 - execute_query() returns pd.DataFrame
+- execute_query_arrow() returns pa.Table
+- execute_query_iter() yields pd.DataFrame chunks
 - get_schema() returns dict with tables list
 - get_table_info() returns dict with schema DataFrame
 - etc.
@@ -26,15 +28,18 @@ that work on the DuckDB backend. Use set_dataset()
 to switch between datasets.
 """
 
+import functools
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from oasis.config import get_active_dataset as _get_active_dataset
 from oasis.config import set_active_dataset as _set_active_dataset
 from oasis.core.datasets import DatasetRegistry
 from oasis.core.exceptions import DatasetError, ModalityError, OASISError, QueryError
-from oasis.core.tools import ToolRegistry, ToolSelector, init_tools
+from oasis.core.tools import Tool, ToolRegistry, ToolSelector, init_tools
 from oasis.core.tools.tabular import (
     ExecuteQueryInput,
     GetDatabaseSchemaInput,
@@ -47,6 +52,24 @@ init_tools()
 # Tool selector for compatibility checking
 _tool_selector = ToolSelector()
 
+
+@functools.lru_cache(maxsize=None)
+def _get_tool(name: str) -> Tool:
+    """Look up a registered tool once and reuse it for later calls.
+
+    Tools are stateless, so the cached instance stays valid even if the
+    registry is re-initialized. Call ``_get_tool.cache_clear()`` after
+    registering replacement tools.
+    """
+    tool = ToolRegistry.get(name)
+    if tool is None:
+        # Registry was reset since import; re-register before giving up
+        init_tools()
+        tool = ToolRegistry.get(name)
+    if tool is None:
+        raise OASISError(f"Tool '{name}' is not registered")
+    return tool
+
 # Re-export exceptions for convenience
 __all__ = [
     "DatasetError",
@@ -54,6 +77,8 @@ __all__ = [
     "OASISError",
     "QueryError",
     "execute_query",
+    "execute_query_arrow",
+    "execute_query_iter",
     "get_active_dataset",
     "get_schema",
     "get_table_info",
@@ -143,7 +168,7 @@ def get_schema() -> dict[str, Any]:
         ['vf.facilities', ...]
     """
     dataset = DatasetRegistry.get_active()
-    tool = ToolRegistry.get("get_database_schema")
+    tool = _get_tool("get_database_schema")
     return tool.invoke(dataset, GetDatabaseSchemaInput())
 
 
@@ -170,7 +195,7 @@ def get_table_info(table_name: str, show_sample: bool = True) -> dict[str, Any]:
         >>> print(info['sample'])  # DataFrame with sample rows
     """
     dataset = DatasetRegistry.get_active()
-    tool = ToolRegistry.get("get_table_info")
+    tool = _get_tool("get_table_info")
     return tool.invoke(
         dataset, GetTableInfoInput(table_name=table_name, show_sample=show_sample)
     )
@@ -194,5 +219,60 @@ def execute_query(sql: str) -> pd.DataFrame:
         >>> print(df)
     """
     dataset = DatasetRegistry.get_active()
-    tool = ToolRegistry.get("execute_query")
+    tool = _get_tool("execute_query")
     return tool.invoke(dataset, ExecuteQueryInput(sql_query=sql))
+
+
+def execute_query_arrow(sql: str) -> pa.Table:
+    """Execute a SQL SELECT query and return the result as a pyarrow Table.
+
+    Same validation as execute_query(), but skips pandas materialization,
+    which is cheaper for large results consumed column-wise (Arrow,
+    Polars, DuckDB, Parquet writers). Call ``.to_pandas()`` on the result
+    if a DataFrame is needed after all.
+
+    Args:
+        sql: SQL SELECT query string.
+
+    Returns:
+        pa.Table with query results.
+
+    Raises:
+        SecurityError: If query violates security constraints.
+        QueryError: If query execution fails.
+
+    Example:
+        >>> table = execute_query_arrow("SELECT name, lat, long FROM vf.facilities")
+        >>> table.num_rows
+    """
+    dataset = DatasetRegistry.get_active()
+    tool = _get_tool("execute_query")
+    return tool.invoke_arrow(dataset, ExecuteQueryInput(sql_query=sql))
+
+
+def execute_query_iter(sql: str, chunk_rows: int = 122_880) -> Iterator[pd.DataFrame]:
+    """Execute a SQL SELECT query and yield the result in DataFrame chunks.
+
+    Use this instead of execute_query() for large scans: only one chunk
+    is held in memory at a time. The query is validated immediately;
+    execution starts on the first iteration.
+
+    Args:
+        sql: SQL SELECT query string.
+        chunk_rows: Approximate number of rows per chunk (default: 122880).
+
+    Returns:
+        Iterator of pd.DataFrame chunks with the same columns and dtypes
+        as execute_query() would return.
+
+    Raises:
+        SecurityError: If query violates security constraints.
+        QueryError: If query execution fails (raised while iterating).
+
+    Example:
+        >>> for chunk in execute_query_iter("SELECT * FROM vf.facilities"):
+        ...     process(chunk)
+    """
+    dataset = DatasetRegistry.get_active()
+    tool = _get_tool("execute_query")
+    return tool.invoke_iter(dataset, ExecuteQueryInput(sql_query=sql), chunk_rows)
@@ -25,6 +25,10 @@ def init_apps() -> None:
     """
     global _apps_initialized
 
+    # Fast path: skip the lock once initialized (re-checked under the lock)
+    if _apps_initialized:
+        return
+
     with _apps_lock:
         if _apps_initialized:
             return
@@ -0,0 +1,116 @@
+"""Two-tier (in-memory dict + SQLite) cache shared by the cleaning steps."""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# Keys per SQLite ``IN (...)`` lookup, below the default variable limit
+_LOOKUP_CHUNK = 500
+
+
+class SQLiteCache(Generic[V]):
+    """Cache of values keyed by a string, persisted to a SQLite table.
+
+    Lookups hit an in-process dict first, then the table, so values survive
+    across runs.  With ``path=None`` only the in-memory tier is used.  SQLite
+    errors are logged and never raised: a failed read counts as a miss and
+    a failed write keeps the value in memory only.  Safe to share between
+    threads.
+
+    Subclasses describe their table with ``table`` and ``columns`` (the
+    value columns stored after the key, as ``"name TYPE"``; a ``ts``
+    timestamp column is appended), turn a stored row back into a value
+    with ``_decode`` and expose a domain-specific get/set API on top of
+    ``_get_many`` / ``_put_many``.
+    """
+
+    table: str
+    columns: tuple[str, ...]
+    label: str  # used in log messages, e.g. "Geocode"
+
+    def __init__(self, path: Path | None = None):
+        self._memory: dict[str, V] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._read_failed = False
+        self._select = "SELECT key, {} FROM {} WHERE key IN ({{}})".format(
+            ", ".join(col.split()[0] for col in self.columns), self.table
+        )
+        self._insert = "INSERT OR REPLACE INTO {} VALUES ({})".format(
+            self.table, ", ".join("?" * (len(self.columns) + 2))
+        )
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                f"key TEXT PRIMARY KEY, {', '.join(self.columns)}, ts INTEGER)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("%s cache disabled, cannot open %s: %s", self.label, path, e)
+            self._conn = None
+
+    def _decode(self, row: tuple[Any, ...]) -> V:
+        """Turn the stored value columns of one row back into a value."""
+        return row  # type: ignore[return-value]
+
+    def _get_many(self, keys: list[str]) -> list[V | None]:
+        """Return the cached value for each key, None where it is a miss."""
+        with self._lock:
+            found = {k: self._memory[k] for k in keys if k in self._memory}
+            missing = [k for k in dict.fromkeys(keys) if k not in found]
+            if self._conn is not None:
+                try:
+                    for start in range(0, len(missing), _LOOKUP_CHUNK):
+                        chunk = missing[start : start + _LOOKUP_CHUNK]
+                        rows = self._conn.execute(
+                            self._select.format(",".join("?" * len(chunk))), chunk
+                        ).fetchall()
+                        for key, *stored in rows:
+                            value = self._decode(tuple(stored))
+                            self._memory[key] = found[key] = value
+                except sqlite3.Error as e:
+                    # Treat the rest as misses (e.g. SQLITE_BUSY, a corrupt page)
+                    if not self._read_failed:
+                        logger.warning(
+                            "Could not read %s cache entries: %s", self.label, e
+                        )
+                        self._read_failed = True
+        return [found.get(k) for k in keys]
+
+    def _put_many(self, entries: Iterable[tuple[str, V, tuple[Any, ...]]]) -> None:
+        """Store ``(key, value, stored columns)`` entries in memory and on disk."""
+        entries = list(entries)
+        with self._lock:
+            self._memory.update((key, value) for key, value, _ in entries)
+            if self._conn is None:
+                return
+            ts = int(time.time())
+            try:
+                self._conn.executemany(
+                    self._insert,
+                    [(key, *stored, ts) for key, _, stored in entries],
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning("Could not write %s cache entries: %s", self.label, e)
+
+    def close(self) -> None:
+        """Close the SQLite connection (the in-memory tier stays usable)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,75 @@
+"""Run a column-wise cleaning function over row chunks in worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar, Union
+
+import pandas as pd
+
+T = TypeVar("T")
+
+Chunkable = Union[pd.DataFrame, pd.Series, dict[str, pd.Series]]
+
+# Below this many rows, work runs in-process: starting workers and
+# pickling the chunks would cost more than it saves
+PARALLEL_MIN_ROWS = 100_000
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """Return a start method that does not fork the parent process.
+
+    Forking after torch / BLAS have started their thread pools can deadlock
+    the children, so workers come from a fork server where available and
+    are spawned otherwise.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _n_rows(arg: Chunkable) -> int:
+    if isinstance(arg, dict):
+        return len(next(iter(arg.values()), ()))
+    return len(arg)
+
+
+def _slice(arg: Chunkable, start: int, stop: int) -> Chunkable:
+    if isinstance(arg, dict):
+        return {key: values.iloc[start:stop] for key, values in arg.items()}
+    return arg.iloc[start:stop]
+
+
+def map_row_chunks(
+    func: Callable[..., T], *args: Chunkable, max_workers: int | None = None
+) -> list[T]:
+    """Call ``func`` on matching row chunks of ``args`` in worker processes.
+
+    Every argument is a DataFrame, Series or dict of Series with the same
+    number of rows; each is sliced by position, so ``func`` receives the
+    same rows from all of them.  Callers should pass only the columns
+    ``func`` reads, since every chunk is pickled to its worker.
+
+    Frames below ``PARALLEL_MIN_ROWS`` (or with a single CPU available)
+    are processed in one in-process call.
+
+    Returns:
+        One result per chunk, in row order.
+    """
+    n_rows = _n_rows(args[0])
+    n_workers = max_workers or os.cpu_count() or 1
+    if n_rows < PARALLEL_MIN_ROWS or n_workers < 2:
+        return [func(*args)]
+
+    chunk_size = -(-n_rows // n_workers)
+    bounds = range(0, n_rows, chunk_size)
+    chunked_args = [
+        [_slice(arg, start, start + chunk_size) for start in bounds] for arg in args
+    ]
+    with ProcessPoolExecutor(
+        max_workers=n_workers, mp_context=_mp_context()
+    ) as executor:
+        return list(executor.map(func, *chunked_args))
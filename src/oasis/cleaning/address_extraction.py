@@ -20,116 +20,318 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
 import re
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from oasis.cleaning._parallel import map_row_chunks
+from oasis.config import _PROJECT_DATA_DIR
 
 logger = logging.getLogger(__name__)
 
 # ── Address cleaning patterns ─────────────────────────────────────────
 
 # Remove parenthetical text: (Near Mexico Hotel), (Opposite Benab Oil ...)
-_PARENTHETICAL = re.compile(r"\([^)]*\)")
-
-# Remove landmark-style prefixes/phrases
-_LANDMARK_PHRASES = re.compile(
-    r"\b(Near|Opposite|Behind|Close to|Adjacent to|Next to|Beside|In front of|Closest station is)\b[^,]*",
+# and landmark-style prefixes/phrases in a single pass.  A landmark phrase
+# runs to the next comma, skipping over any parenthetical it contains.
+_ADDRESS_NOISE = re.compile(
+    r"\([^)]*\)"
+    r"|\b(?:Near|Opposite|Behind|Close to|Adjacent to|Next to|Beside|In front of"
+    r"|Closest station is)\b(?:\([^)]*\)|[^,])*",
     re.IGNORECASE,
 )
 
 
-def _find_project_root() -> Path:
-    """Find the project root (directory containing pyproject.toml or oasis_data)."""
-    current = Path(__file__).resolve().parent
-    for _ in range(10):
-        if (current / "pyproject.toml").exists() or (current / "oasis_data").exists():
-            return current
-        current = current.parent
-    return Path.cwd()
-
-
 def _clean_address(raw: str) -> str:
     """Strip noise from an address string for geocoding.
 
     Removes parenthetical text, landmark references, and excess whitespace.
     """
-    s = _PARENTHETICAL.sub("", raw)
-    s = _LANDMARK_PHRASES.sub("", s)
+    s = _ADDRESS_NOISE.sub("", raw)
     # Collapse whitespace and strip dangling commas / dots
-    s = re.sub(r"\s+", " ", s).strip()
-    s = s.strip(".,;: ")
-    return s
+    s = " ".join(s.split())
+    return s.strip(".,;: ")
+
+
+# Input columns used to build the geocoding candidates
+_ADDRESS_COLUMNS = ["name", "address_city", "address_line1"]
+
+# Below this many rows the scalar per-row builder is faster than the
+# column-wise one
+_VECTORIZE_MIN_ROWS = 5_000
 
+# Bump when candidate building changes so stale caches are not reused
+_CACHE_VERSION = 2
 
-def _build_geo_queries(row: pd.Series) -> str:
-    """Build a ranked list of geocoding query candidates for a facility row.
+# geo_queries cache files kept on disk; older ones are deleted on write
+_CACHE_MAX_FILES = 4
 
-    Returns a JSON-encoded list of strings.
+# Arrow-backed strings: strip / concatenation run in Arrow's C++ kernels
+_STR_DTYPE = pd.StringDtype("pyarrow")
+
+
+def _clean_str_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a stripped string column, with "" for missing values.
+
+    Stripping runs on Python strings, as in ``_as_str``: Arrow's kernels
+    only treat ASCII characters as whitespace.
     """
-    candidates: list[str] = []
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=_STR_DTYPE)
+    stripped = df[column].astype(_STR_DTYPE).fillna("").astype(object).str.strip()
+    return stripped.astype(_STR_DTYPE)
+
+
+def _clean_address_column(addr: pd.Series) -> pd.Series:
+    """Vectorized ``_clean_address`` over a column of address strings.
+
+    The regex and whitespace steps run on object dtype, i.e. with Python
+    ``re`` and ``str.split``, so non-ASCII whitespace is handled exactly as
+    in ``_clean_address`` (Arrow's RE2 ``\\s`` is ASCII-only).
+    """
+    return (
+        addr.astype(object)
+        .str.replace(_ADDRESS_NOISE, "", regex=True)
+        .str.split()
+        .str.join(" ")
+        .str.strip(".,;: ")
+        .astype(_STR_DTYPE)
+    )
+
+
+def _as_str(value: object) -> str:
+    """Return a stripped string, or "" for None / NaN."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value).strip()
 
-    name = row.get("name")
-    name = str(name).strip() if pd.notna(name) and str(name).strip() else ""
 
-    city = row.get("address_city")
-    city = str(city).strip() if pd.notna(city) and str(city).strip() else ""
+def _build_row_queries(name: object, city: object, addr1: object) -> list[str]:
+    """Build the ranked candidate list for a single facility.
 
-    addr1 = row.get("address_line1")
-    addr1 = str(addr1).strip() if pd.notna(addr1) and str(addr1).strip() else ""
+    Scalar counterpart of ``_build_geo_queries`` that takes the raw cell
+    values directly, without wrapping the row in a ``pd.Series``.
+    """
+    name = _as_str(name)
+    city = _as_str(city)
+    cleaned = _clean_address(_as_str(addr1))
+
+    candidates: list[str] = []
 
     # Candidate 1: name only
+    # Candidate 2: name + city + Ghana
     if name:
         candidates.append(name)
-
-    # Candidate 2: name + city + Ghana
-    if name and city:
-        candidates.append(f"{name}, {city}, Ghana")
+        if city:
+            candidates.append(f"{name}, {city}, Ghana")
 
     # Candidate 3: cleaned address_line1 + city + Ghana
-    if addr1:
-        cleaned = _clean_address(addr1)
-        if cleaned and city:
-            q = f"{cleaned}, {city}, Ghana"
-            if q not in candidates:
-                candidates.append(q)
-        elif cleaned:
-            q = f"{cleaned}, Ghana"
-            if q not in candidates:
-                candidates.append(q)
+    if cleaned:
+        q = f"{cleaned}, {city}, Ghana" if city else f"{cleaned}, Ghana"
+        if q not in candidates:
+            candidates.append(q)
 
     # Fallback: if we have nothing, try city alone
     if not candidates and city:
         candidates.append(f"{city}, Ghana")
 
+    return candidates
+
+
+def _where(mask: np.ndarray, values: pd.Series) -> np.ndarray:
+    """Return ``values`` as an object array with "" wherever ``mask`` is False."""
+    out = values.to_numpy(dtype=object)
+    out[~mask] = ""
+    return out
+
+
+def _build_geo_queries(df: pd.DataFrame) -> list[list[str]]:
+    """Build ranked lists of geocoding query candidates for every row.
+
+    Works column-wise: the name, city and address columns are normalized
+    and cleaned once for the whole frame, then the candidates are
+    assembled from boolean masks.  Small frames, where the per-column
+    setup costs more than it saves, go through ``_build_row_queries``
+    over plain value tuples instead.
+
+    Returns:
+        One list of candidate query strings per row, in ``df`` order.
+    """
+    if len(df) < _VECTORIZE_MIN_ROWS:
+        values = df.reindex(columns=_ADDRESS_COLUMNS).to_numpy(dtype=object)
+        return [_build_row_queries(*row) for row in values]
+
+    name = _clean_str_column(df, "name")
+    city = _clean_str_column(df, "address_city")
+    cleaned = _clean_address_column(_clean_str_column(df, "address_line1"))
+
+    # NA masks, computed once per column (values are never NA past here)
+    has_name = name.ne("").to_numpy(dtype=bool)
+    has_city = city.ne("").to_numpy(dtype=bool)
+    has_cleaned = cleaned.ne("").to_numpy(dtype=bool)
+
+    # Candidate 1: name only
+    cand1 = name.to_numpy(dtype=object)
+
+    # Candidate 2: name + city + Ghana
+    cand2 = _where(has_name & has_city, name + ", " + city + ", Ghana")
+
+    # Candidate 3: cleaned address_line1 + city + Ghana
+    cand3 = np.where(
+        has_city,
+        _where(has_cleaned, cleaned + ", " + city + ", Ghana"),
+        _where(has_cleaned, cleaned + ", Ghana"),
+    )
+
+    # Fallback: if we have nothing, try city alone
+    cand4 = _where(~has_name & ~has_cleaned & has_city, city + ", Ghana")
+
+    # dict.fromkeys de-duplicates while keeping rank order; drop empty slots
+    return [
+        [q for q in dict.fromkeys(row) if q]
+        for row in zip(cand1, cand2, cand3, cand4)
+    ]
+
+
+def _dumps_queries(candidates: list[str]) -> str:
+    """JSON-encode a candidate list as written to ``geo_queries``.
+
+    Keeps ``json.dumps``' default ``", "`` separators so the column (and
+    the final CSV) is byte-identical to earlier releases.
+    """
     return json.dumps(candidates, ensure_ascii=False)
 
 
-def run_address_extraction(df: pd.DataFrame) -> pd.DataFrame:
+def _cache_path(keys: pd.DataFrame) -> Path | None:
+    """Return the Parquet cache file for a frame of address key columns.
+
+    Returns None (no caching) when the keys cannot be hashed, e.g. text
+    with lone surrogates that has no UTF-8 encoding.
+    """
+    try:
+        hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    except ValueError as e:
+        logger.warning("geo_queries cache disabled, cannot hash input: %s", e)
+        return None
+    digest = hashlib.blake2b(hashes.tobytes(), digest_size=8)
+    digest.update(f"v{_CACHE_VERSION}".encode())
+    return (
+        _PROJECT_DATA_DIR
+        / "cache"
+        / f"geo_queries_{digest.hexdigest()}.parquet"
+    )
+
+
+def _read_cache(path: Path, n_rows: int) -> np.ndarray | None:
+    """Load cached geo_queries, or None if missing, unreadable or stale."""
+    if not path.exists():
+        return None
+    try:
+        cached = pd.read_parquet(path, columns=["geo_queries"])["geo_queries"]
+    except Exception as e:
+        logger.warning("Ignoring unreadable geo_queries cache %s: %s", path, e)
+        return None
+    if len(cached) != n_rows:
+        return None
+    # Mark as recently used so _prune_cache keeps it
+    try:
+        path.touch()
+    except OSError:
+        pass
+    return cached.to_numpy(dtype=object)
+
+
+def _write_cache(path: Path, geo_queries: pd.Series) -> None:
+    """Persist geo_queries to the Parquet cache (best effort)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({"geo_queries": geo_queries.to_numpy(dtype=object)}).to_parquet(
+            path, index=False, compression="zstd"
+        )
+    except (OSError, pa.ArrowException, ValueError) as e:
+        # ValueError covers text Arrow cannot encode (e.g. lone surrogates)
+        logger.warning("Could not write geo_queries cache %s: %s", path, e)
+        path.unlink(missing_ok=True)
+        return
+    _prune_cache(path.parent)
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete all but the ``_CACHE_MAX_FILES`` most recently used cache files."""
+    try:
+        files = sorted(
+            cache_dir.glob("geo_queries_*.parquet"),
+            key=lambda f: f.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in files[_CACHE_MAX_FILES:]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not prune geo_queries cache %s: %s", cache_dir, e)
+
+
+def run_address_extraction(df: pd.DataFrame, use_cache: bool = True) -> pd.DataFrame:
     """Extract and build ranked geo_queries column.
 
     Adds column: geo_queries (JSON array of candidate query strings).
 
+    The result depends only on the name / address_city / address_line1
+    columns, so it is cached as Parquet under ``oasis_data/cache`` keyed by
+    a hash of those columns; re-running on the same input skips the work.
+    Only the ``_CACHE_MAX_FILES`` most recently used inputs are kept.
+
     Args:
         df: DataFrame (output of heuristic steps 1-3).
+        use_cache: Read and write the on-disk geo_queries cache.
 
     Returns:
         DataFrame with the new geo_queries column.
     """
-    df = df.copy()
+    keys = df.reindex(columns=_ADDRESS_COLUMNS).fillna("")
+
+    cache_path = _cache_path(keys) if use_cache else None
+    if cache_path is not None:
+        cached = _read_cache(cache_path, len(df))
+        if cached is not None:
+            logger.info(
+                "Step 3.5 complete: loaded geo_queries for %d facilities from %s",
+                len(df),
+                cache_path,
+            )
+            return df.assign(geo_queries=cached)
+
+    # Build and encode candidates once per distinct (name, city, address)
+    # combination, then broadcast back to all rows sharing it
+    codes, uniques = pd.MultiIndex.from_frame(keys).factorize()
+    chunks = map_row_chunks(
+        _build_geo_queries, uniques.to_frame(index=False, name=_ADDRESS_COLUMNS)
+    )
+    candidates = [queries for chunk in chunks for queries in chunk]
 
-    df["geo_queries"] = df.apply(_build_geo_queries, axis=1)
+    encoded = np.empty(len(candidates), dtype=object)
+    encoded[:] = [_dumps_queries(c) for c in candidates]
+    df = df.assign(geo_queries=encoded[codes])
 
     # Log stats
-    n_candidates = df["geo_queries"].apply(lambda s: len(json.loads(s)))
+    n_candidates = np.fromiter(
+        (len(c) for c in candidates), dtype=np.int32, count=len(candidates)
+    )[codes]
     logger.info(
         "Step 3.5 complete: built geo_queries for %d facilities "
         "(avg %.1f candidates/facility, max %d)",
         len(df),
-        n_candidates.mean(),
-        n_candidates.max(),
+        n_candidates.mean() if len(n_candidates) else 0.0,
+        n_candidates.max(initial=0),
     )
 
+    if cache_path is not None:
+        _write_cache(cache_path, df["geo_queries"])
+
     return df
@@ -22,12 +22,20 @@ from __future__ import annotations
 
 import logging
 import re
+import warnings
+from collections.abc import Callable
 
 import numpy as np
 import pandas as pd
 
+from oasis.cleaning._parallel import map_row_chunks
 from oasis.cleaning.column_cleaning import safe_parse_list
 
+try:
+    import faiss
+except ImportError:  # pragma: no cover - optional speedup
+    faiss = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +85,35 @@ _CONCRETE_EQUIPMENT = re.compile(
     re.IGNORECASE,
 )
 
+# Operating hours: round-the-clock claims vs. specific limited weekday hours
+_HOURS_24_7 = re.compile(r"\b(24.?hour|24/7|always open)\b", re.IGNORECASE)
+_LIMITED_HOURS = re.compile(
+    r"\b(mon|tue|wed|thu|fri|sat|sun)\b.{0,20}\b\d{1,2}\s*[ap]m\b",
+    re.IGNORECASE,
+)
+
+
+def _lowercase_variant(pattern: re.Pattern) -> re.Pattern:
+    """Case-sensitive twin of an IGNORECASE pattern, for already-lowered text.
+
+    The rule checks search text that was lowercased up front, so matching a
+    lowercased pattern without IGNORECASE finds the same hits while skipping
+    the engine's per-character case folding.  Patterns using uppercase
+    escapes (``\\S``, ``\\W``, ...) would change meaning and are returned as is.
+    """
+    if re.search(r"\\[A-Z]", pattern.pattern):
+        return pattern
+    return re.compile(pattern.pattern.lower())
+
+
+# Variants used against the lowercased rule-check texts
+_SURGICAL_LOWER = _lowercase_variant(_SURGICAL_KEYWORDS)
+_IMAGING_LOWER = _lowercase_variant(_IMAGING_KEYWORDS)
+_MARKETING_LOWER = _lowercase_variant(_MARKETING_KEYWORDS)
+_CONCRETE_EQUIPMENT_LOWER = _lowercase_variant(_CONCRETE_EQUIPMENT)
+_HOURS_24_7_LOWER = _lowercase_variant(_HOURS_24_7)
+_LIMITED_HOURS_LOWER = _lowercase_variant(_LIMITED_HOURS)
+
 # Specialties that a pharmacy should NOT have
 _NON_PHARMACY_SPECIALTIES = {
     "generalSurgery", "cardiology", "neurology", "oncology",
@@ -98,135 +135,264 @@ _NON_DENTAL_SPECIALTIES = {
 }
 
 
-def _detect_anomalies_for_row(
-    name: str,
-    facility_type: str | None,
-    specialties: list[str],
-    procedures: list[str],
-    equipment: list[str],
-    capabilities: list[str],
-    capacity: float | None,
-    num_doctors: float | None,
-) -> str | None:
-    """Run all rule-based anomaly checks on a single facility."""
-    anomalies: list[str] = []
+# List-literal columns read by the rule and embedding checks
+_LIST_COLUMNS = ("specialties", "procedure", "equipment", "capability")
 
-    # Join text for keyword searches
-    proc_text = " ".join(procedures).lower()
-    equip_text = " ".join(equipment).lower()
-    cap_text = " ".join(capabilities).lower()
-    all_text = f"{proc_text} {equip_text} {cap_text}"
 
-    num_specialties = len(specialties)
-    num_procedures = len(procedures)
-    num_equipment = len(equipment)
-    num_capabilities = len(capabilities)
+def _parse_list_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Parse a list-literal column into a Series of Python lists."""
+    if column not in df.columns:
+        return pd.Series([[] for _ in range(len(df))], index=df.index, dtype=object)
+    return pd.Series(
+        [safe_parse_list(v) for v in df[column]], index=df.index, dtype=object
+    )
+
 
-    ft = (facility_type or "").lower().strip()
+def _parse_list_columns(df: pd.DataFrame) -> dict[str, pd.Series]:
+    """Parse every column in ``_LIST_COLUMNS`` once, keyed by column name.
+
+    The parsed lists are shared by the rule checks and the embedding text
+    builder instead of each re-running ``safe_parse_list`` on the same cells.
+    """
+    return {col: _parse_list_column(df, col) for col in _LIST_COLUMNS}
+
+
+def _contains(
+    texts: pd.Series, pattern: re.Pattern, rows: np.ndarray | None = None
+) -> np.ndarray:
+    """Boolean mask of the texts that ``pattern`` matches anywhere in.
+
+    If ``rows`` is given, only those rows are searched and the rest are
+    reported as non-matching (e.g. rows whose text is known to be empty).
+    """
+    if rows is not None:
+        out = np.zeros(len(texts), dtype=bool)
+        if rows.any():
+            out[rows] = _contains(texts[rows], pattern)
+        return out
+    with warnings.catch_warnings():
+        # Capture groups are irrelevant for a yes/no match
+        warnings.filterwarnings("ignore", "This pattern is interpreted", UserWarning)
+        return texts.str.contains(pattern).to_numpy(dtype=bool)
+
+
+def _detect_rule_anomalies(
+    df: pd.DataFrame, parsed: dict[str, pd.Series] | None = None
+) -> np.ndarray:
+    """Run all rule-based anomaly checks over the whole DataFrame.
+
+    Keyword searches and count predicates are evaluated column-wise into
+    boolean masks, which are packed into one int32 bitmap (one bit per
+    check).  Only rows with a non-zero bitmap are decoded in Python, and
+    only the rules whose description quotes row-specific values (specialty
+    names, matched phrases) do any further per-row work.
+
+    Args:
+        df: Facility DataFrame.
+        parsed: Pre-parsed list columns from ``_parse_list_columns``; parsed
+            here when omitted.
+
+    Returns:
+        Object array aligned with ``df`` rows: None if clean, otherwise the
+        "; "-joined descriptions of every triggered rule, in rule order.
+    """
+    if parsed is None:
+        parsed = _parse_list_columns(df)
+    specialties = parsed["specialties"]
+    procedures = parsed["procedure"]
+    equipment = parsed["equipment"]
+    capabilities = parsed["capability"]
+
+    # Join text for keyword searches
+    proc_text = procedures.str.join(" ").str.lower()
+    equip_text = equipment.str.join(" ").str.lower()
+    cap_text = capabilities.str.join(" ").str.lower()
+    all_text = proc_text + " " + equip_text + " " + cap_text
+
+    num_specialties = specialties.str.len().to_numpy()
+    num_procedures = procedures.str.len().to_numpy()
+    num_equipment = equipment.str.len().to_numpy()
+    num_capabilities = capabilities.str.len().to_numpy()
+
+    if "facilityTypeId" in df.columns:
+        ft_col = df["facilityTypeId"]
+        ft = ft_col.where(ft_col.notna(), "").astype(str).str.lower().str.strip()
+    else:
+        ft = pd.Series("", index=df.index)
+    is_pharmacy = (ft == "pharmacy").to_numpy()
+    is_dentist = (ft == "dentist").to_numpy()
+    is_hospital = (ft == "hospital").to_numpy()
+
+    # Keyword searches skip rows whose lists are all empty: there is
+    # nothing in their text to match
+    has_any_text = (num_procedures + num_equipment + num_capabilities) > 0
+    has_surgical = _contains(all_text, _SURGICAL_LOWER, has_any_text)
+
+    spec_lists = specialties.to_numpy()
+    proc_texts = proc_text.to_numpy(dtype=object)
+    all_texts = all_text.to_numpy(dtype=object)
+
+    # (candidate mask, description) per check, in rule order.  A callable
+    # description is evaluated per candidate row and may return None when
+    # the row turns out not to be anomalous.
+    checks: list[tuple[np.ndarray, str | Callable[[int], str | None]]] = []
 
     # ── Rule 1: Pharmacy claiming surgery or advanced specialties ─────
-    if ft == "pharmacy":
-        pharmacy_bad_specs = [s for s in specialties if s in _NON_PHARMACY_SPECIALTIES]
-        if pharmacy_bad_specs:
-            anomalies.append(
-                f"Pharmacy claims advanced specialties not typical for pharmacies: "
-                f"{', '.join(pharmacy_bad_specs)}"
-            )
-        if _SURGICAL_KEYWORDS.search(all_text):
-            anomalies.append(
-                "Pharmacy claims surgical procedures or capabilities, "
-                "which is inconsistent with a pharmacy facility type"
-            )
+    def _pharmacy_specs(pos: int) -> str | None:
+        bad = [s for s in spec_lists[pos] if s in _NON_PHARMACY_SPECIALTIES]
+        if not bad:
+            return None
+        return (
+            f"Pharmacy claims advanced specialties not typical for pharmacies: "
+            f"{', '.join(bad)}"
+        )
 
+    checks.append((is_pharmacy, _pharmacy_specs))
+    checks.append((
+        is_pharmacy & has_surgical,
+        "Pharmacy claims surgical procedures or capabilities, "
+        "which is inconsistent with a pharmacy facility type",
+    ))
 
     # ── Rule 2: Dentist claiming non-dental specialties ───────────────
-    if ft == "dentist":
-        dentist_bad_specs = [s for s in specialties if s in _NON_DENTAL_SPECIALTIES]
-        if dentist_bad_specs:
-            anomalies.append(
-                f"Dental facility claims non-dental specialties: "
-                f"{', '.join(dentist_bad_specs)}"
-            )
+    def _dentist_specs(pos: int) -> str | None:
+        bad = [s for s in spec_lists[pos] if s in _NON_DENTAL_SPECIALTIES]
+        if not bad:
+            return None
+        return f"Dental facility claims non-dental specialties: {', '.join(bad)}"
 
+    checks.append((is_dentist, _dentist_specs))
 
     # ── Rule 3: Claims surgery but lists zero equipment ───────────────
-    if _SURGICAL_KEYWORDS.search(all_text) and num_equipment == 0:
-        anomalies.append(
-            "Claims surgical procedures/capabilities but has no equipment listed — "
-            "may indicate unverified or aspirational claims"
-        )
-
+    checks.append((
+        has_surgical & (num_equipment == 0),
+        "Claims surgical procedures/capabilities but has no equipment listed — "
+        "may indicate unverified or aspirational claims",
+    ))
 
     # ── Rule 4: Many specialties but no supporting evidence ───────────
-    if num_specialties >= 6 and num_procedures == 0 and num_equipment == 0:
-        anomalies.append(
-            f"Claims {num_specialties} specialties but has zero procedures "
+    checks.append((
+        (num_specialties >= 6) & (num_procedures == 0) & (num_equipment == 0),
+        lambda pos: (
+            f"Claims {num_specialties[pos]} specialties but has zero procedures "
             f"and zero equipment listed — breadth of claims lacks supporting evidence"
-        )
-
+        ),
+    ))
 
     # ── Rule 5: Hospital with essentially no medical info ─────────────
-    if ft == "hospital" and num_procedures == 0 and num_equipment == 0 and num_capabilities == 0:
-        if num_specialties <= 1:
-            anomalies.append(
-                "Hospital with virtually no medical information — "
-                "no procedures, no equipment, no capabilities, "
-                "and at most 1 specialty listed"
-            )
-
+    checks.append((
+        is_hospital
+        & (num_procedures == 0)
+        & (num_equipment == 0)
+        & (num_capabilities == 0)
+        & (num_specialties <= 1),
+        "Hospital with virtually no medical information — "
+        "no procedures, no equipment, no capabilities, "
+        "and at most 1 specialty listed",
+    ))
 
     # ── Rule 6: Claims advanced imaging in procedures but not in equipment ──
-    if num_procedures > 0 and num_equipment == 0:
-        imaging_in_proc = _IMAGING_KEYWORDS.findall(proc_text)
-        if imaging_in_proc:
-            unique_imaging = list(set(m.upper() for m in imaging_in_proc))
-            anomalies.append(
-                f"Claims imaging services ({', '.join(unique_imaging[:3])}) in procedures "
-                f"but lists no equipment at all — equipment should support these claims"
-            )
+    def _imaging_without_equipment(pos: int) -> str | None:
+        imaging_in_proc = _IMAGING_LOWER.findall(proc_texts[pos])
+        unique_imaging = list(set(m.upper() for m in imaging_in_proc))
+        return (
+            f"Claims imaging services ({', '.join(unique_imaging[:3])}) in procedures "
+            f"but lists no equipment at all — equipment should support these claims"
+        )
 
+    checks.append((
+        (num_procedures > 0)
+        & (num_equipment == 0)
+        & _contains(
+            proc_text, _IMAGING_LOWER, (num_procedures > 0) & (num_equipment == 0)
+        ),
+        _imaging_without_equipment,
+    ))
 
     # ── Rule 7: Contradictory operating hours ─────────────────────────
-    has_24_7 = bool(re.search(r"\b(24.?hour|24/7|always open)\b", cap_text, re.IGNORECASE))
-    has_limited = bool(re.search(
-        r"\b(mon|tue|wed|thu|fri|sat|sun)\b.{0,20}\b\d{1,2}\s*[ap]m\b",
-        cap_text, re.IGNORECASE,
+    has_24_7 = _contains(cap_text, _HOURS_24_7_LOWER, num_capabilities > 0)
+    # Limited hours only matter alongside a 24/7 claim
+    has_limited = _contains(cap_text, _LIMITED_HOURS_LOWER, has_24_7)
+    checks.append((
+        has_24_7 & has_limited,
+        "Contradictory operating hours — claims 24/7 or always open "
+        "but also lists specific limited weekday hours",
     ))
-    if has_24_7 and has_limited:
-        anomalies.append(
-            "Contradictory operating hours — claims 24/7 or always open "
-            "but also lists specific limited weekday hours"
-        )
-
 
     # ── Rule 8: Marketing overstatement without substance ─────────────
-    marketing_hits = _MARKETING_KEYWORDS.findall(all_text)
-    if marketing_hits:
-        num_marketing = len(marketing_hits)
-        has_concrete_equip = bool(_CONCRETE_EQUIPMENT.search(equip_text))
+    # Counting matches needs no match strings; the phrases are only
+    # extracted (findall) for the rows that are actually flagged
+    num_marketing = np.zeros(len(df), dtype=np.int64)
+    if has_any_text.any():
+        num_marketing[has_any_text] = (
+            all_text[has_any_text].str.count(_MARKETING_LOWER).to_numpy()
+        )
+    # Concrete equipment only matters for heavy marketing (case A), and can
+    # only be found when some equipment is listed
+    has_concrete_equip = _contains(
+        equip_text,
+        _CONCRETE_EQUIPMENT_LOWER,
+        (num_marketing >= 2) & (num_equipment > 0),
+    )
+
+    def _marketing(pos: int) -> str | None:
         # Case A: heavy marketing (2+) with no concrete equipment at all
-        if num_marketing >= 2 and not has_concrete_equip:
+        if num_marketing[pos] >= 2 and not has_concrete_equip[pos]:
+            marketing_hits = _MARKETING_LOWER.findall(all_texts[pos])
             unique_phrases = sorted(set(h.lower() for h in marketing_hits))
-            anomalies.append(
-                f"Uses {num_marketing} marketing superlatives "
+            return (
+                f"Uses {num_marketing[pos]} marketing superlatives "
                 f"({', '.join(unique_phrases[:4])}) but lists no concrete "
                 f"equipment or devices to substantiate claims — "
                 f"potential overstatement"
             )
         # Case B: marketing language + zero procedures AND zero equipment
-        elif num_marketing >= 1 and num_procedures == 0 and num_equipment == 0:
+        if num_procedures[pos] == 0 and num_equipment[pos] == 0:
+            marketing_hits = _MARKETING_LOWER.findall(all_texts[pos])
             unique_phrases = sorted(set(h.lower() for h in marketing_hits))
-            anomalies.append(
+            return (
                 f"Marketing language ({', '.join(unique_phrases[:3])}) with "
                 f"no procedures and no equipment listed — claims lack "
                 f"verifiable evidence"
             )
-
-    if not anomalies:
         return None
-    return "; ".join(anomalies)
+
+    checks.append((num_marketing >= 1, _marketing))
+
+    # Pack the candidate masks into one bitmap so clean rows are skipped
+    # with a single vectorized test
+    bitmap = np.zeros(len(df), dtype=np.int32)
+    for bit, (mask, _) in enumerate(checks):
+        bitmap |= mask.astype(np.int32) << bit
+
+    result = np.full(len(df), None, dtype=object)
+    for pos in np.flatnonzero(bitmap):
+        bits = int(bitmap[pos])
+        anomalies = []
+        for bit, (_, desc) in enumerate(checks):
+            if bits >> bit & 1:
+                text = desc if isinstance(desc, str) else desc(pos)
+                if text:
+                    anomalies.append(text)
+        if anomalies:
+            result[pos] = "; ".join(anomalies)
+    return result
 
 
+# The only DataFrame column the rule checks read besides the parsed lists
+_RULE_COLUMNS = ["facilityTypeId"]
+
+
+def _detect_rule_anomalies_parallel(
+    df: pd.DataFrame, parsed: dict[str, pd.Series]
+) -> np.ndarray:
+    """Run ``_detect_rule_anomalies`` over row chunks in worker processes.
+
+    Only the columns the checks read are sent to the workers.
+    """
+    columns = df.loc[:, [c for c in _RULE_COLUMNS if c in df.columns]]
+    return np.concatenate(map_row_chunks(_detect_rule_anomalies, columns, parsed))
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Embedding-based anomaly detection
@@ -240,15 +406,26 @@ _OUTLIER_PERCENTILE = 5          # bottom 5% similarity → outlier
 _OUTLIER_ABS_THRESHOLD = 0.15    # also must be below this absolute sim
 _DUPLICATE_THRESHOLD = 0.97      # cosine sim ≥ 0.97 → near-duplicate
 _MIN_GROUP_SIZE = 5              # skip peer-group check for tiny groups
+_SIMILARITY_BLOCK_ROWS = 1024    # rows per similarity-matrix block
+_ENCODE_BATCH_SIZE = 128         # sentences per encoder forward pass
+
 
+def _build_texts(
+    df: pd.DataFrame, parsed: dict[str, pd.Series] | None = None
+) -> list[str]:
+    """Concatenate free-form columns into one string per row for embedding.
 
-def _build_text(row: pd.Series) -> str:
-    """Concatenate free-form columns into a single string for embedding."""
-    parts: list[str] = []
-    for col in _FREEFORM_COLUMNS:
-        items = safe_parse_list(row.get(col))
-        parts.extend(items)
-    return " | ".join(parts) if parts else ""
+    Each column is parsed once as a whole (or taken from ``parsed``), then
+    the per-row item lists are joined with " | " (no ``iterrows`` boxing of
+    every cell).
+    """
+    if parsed is None:
+        parsed = _parse_list_columns(df)
+    columns = [parsed[col] for col in _FREEFORM_COLUMNS]
+    return [
+        " | ".join(proc + equip + cap)
+        for proc, equip, cap in zip(*(col.to_numpy() for col in columns))
+    ]
 
 
 def _detect_peer_outliers(
@@ -256,47 +433,148 @@ def _detect_peer_outliers(
     embeddings: np.ndarray,
     texts: list[str],
 ) -> dict[int, str]:
-    """Flag facilities whose embedding is far from their facility-type centroid."""
+    """Flag facilities whose embedding is far from their facility-type centroid.
+
+    All facility-type groups are handled at once: rows are mapped to group
+    codes, the centroids come from one grouped mean, and every row's
+    similarity to its own centroid is a single row-wise dot product.
+
+    Returns:
+        Descriptions keyed by row position in ``df``.
+    """
     if "facilityTypeId" not in df.columns:
         return {}
 
+    ft_col = df["facilityTypeId"]
+    ft = ft_col.where(ft_col.notna(), "").astype(str).str.strip().str.lower()
+    # Codes follow first appearance, matching the old per-type dict order
+    codes, types = pd.factorize(ft.to_numpy(dtype=object))
+
+    # Skip untyped rows and groups too small overall or in rows with text
+    eligible = (types != "") & (
+        np.bincount(codes, minlength=len(types)) >= _MIN_GROUP_SIZE
+    )
+    has_text = np.fromiter(
+        (bool(t.strip()) for t in texts), dtype=bool, count=len(texts)
+    )
+    valid = has_text & eligible[codes]
+    eligible &= np.bincount(codes[valid], minlength=len(types)) >= _MIN_GROUP_SIZE
+    rows = np.flatnonzero(valid & eligible[codes])
+    if not len(rows):
+        return {}
+
+    row_codes = codes[rows]
+    group_embs = embeddings[rows]
+    centroids = pd.DataFrame(group_embs).groupby(row_codes).mean()
+    centroid_norm = centroids.to_numpy() / (
+        np.linalg.norm(centroids.to_numpy(), axis=1, keepdims=True) + 1e-10
+    )
+    # Position of each row's group in the centroid table
+    centroid_pos = centroids.index.get_indexer(row_codes)
+    sims = np.einsum("ij,ij->i", group_embs, centroid_norm[centroid_pos])
+
+    # Linear-interpolated percentile per group, as np.percentile computes it
+    cutoffs = (
+        pd.Series(sims).groupby(row_codes).quantile(_OUTLIER_PERCENTILE / 100)
+    )
+    threshold = np.minimum(cutoffs.to_numpy(), _OUTLIER_ABS_THRESHOLD)
+    outliers = np.flatnonzero(sims < threshold[centroid_pos])
+
     anomalies: dict[int, str] = {}
+    # Group by group (in first-appearance order), rows in order within each
+    for j in outliers[np.lexsort((rows[outliers], row_codes[outliers]))]:
+        ft_name = types[row_codes[j]]
+        anomalies[int(rows[j])] = (
+            f"Capability profile is an outlier among {ft_name}s "
+            f"(similarity to peer group: {sims[j]:.2f}) — "
+            f"this {ft_name}'s described services are unlike other "
+            f"{ft_name}s in the dataset"
+        )
 
-    type_groups: dict[str, list[int]] = {}
-    for i, (idx, row) in enumerate(df.iterrows()):
-        ft = row.get("facilityTypeId")
-        if pd.notna(ft) and str(ft).strip():
-            ft_str = str(ft).strip().lower()
-            type_groups.setdefault(ft_str, []).append(i)
+    return anomalies
 
-    for ft, indices in type_groups.items():
-        if len(indices) < _MIN_GROUP_SIZE:
-            continue
 
-        valid = [i for i in indices if texts[i].strip()]
-        if len(valid) < _MIN_GROUP_SIZE:
-            continue
+def _select_device() -> str:
+    """Return "cuda" when torch sees a GPU, otherwise "cpu"."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    return "cuda" if torch.cuda.is_available() else "cpu"
 
-        group_embs = embeddings[valid]
-        centroid = group_embs.mean(axis=0)
-        centroid_norm = centroid / (np.linalg.norm(centroid) + 1e-10)
 
-        sims = group_embs @ centroid_norm
+def _similar_pairs_torch(
+    embs, threshold: float, block_rows: int
+) -> list[tuple[int, int, float]]:
+    """``_similar_pairs`` for a torch tensor, computed on the tensor's device.
 
-        percentile_cutoff = float(np.percentile(sims, _OUTLIER_PERCENTILE))
-        threshold = min(percentile_cutoff, _OUTLIER_ABS_THRESHOLD)
+    Only the thresholded pair list is transferred back to the host.
+    """
+    pairs: list[tuple[int, int, float]] = []
+    for start in range(0, len(embs), block_rows):
+        sims = embs[start : start + block_rows] @ embs.T
+        hits = (sims >= threshold).nonzero()
+        rows, cols = hits[:, 0], hits[:, 1]
+        upper = cols > rows + start
+        rows, cols = rows[upper], cols[upper]
+        vals = sims[rows, cols].float().cpu().tolist()
+        for r, c, v in zip(rows.cpu().tolist(), cols.cpu().tolist(), vals):
+            pairs.append((r + start, c, v))
+    return pairs
+
+
+def _similar_pairs_faiss(
+    embs: np.ndarray, threshold: float
+) -> list[tuple[int, int, float]]:
+    """``_similar_pairs`` via a FAISS inner-product range search.
+
+    Only neighbours above ``threshold`` are returned by the index, so the
+    full similarity matrix is never materialized.
+    """
+    index = faiss.IndexFlatIP(embs.shape[1])
+    index.add(embs)
+    lims, sims, cols = index.range_search(embs, threshold)
+    rows = np.repeat(np.arange(len(embs)), np.diff(lims))
+    # Keep each pair once (a < b), in the same row-major order as the
+    # matmul path
+    upper = np.flatnonzero(cols > rows)
+    upper = upper[np.lexsort((cols[upper], rows[upper]))]
+    return list(
+        zip(rows[upper].tolist(), cols[upper].tolist(), sims[upper].tolist())
+    )
 
-        for j, sim in enumerate(sims):
-            if sim < threshold:
-                orig_idx = valid[j]
-                df_idx = df.index[orig_idx]
-                anomalies[df_idx] = (
-                    f"Capability profile is an outlier among {ft}s "
-                    f"(similarity to peer group: {sim:.2f}) — "
-                    f"this {ft}'s described services are unlike other {ft}s in the dataset"
-                )
 
-    return anomalies
+def _similar_pairs(
+    embs: np.ndarray, threshold: float, block_rows: int = _SIMILARITY_BLOCK_ROWS
+) -> list[tuple[int, int, float]]:
+    """Return all (a, b, cosine) pairs with a < b and cosine >= threshold.
+
+    Embeddings are L2-normalized, so a dot product is the cosine. The
+    similarity matrix is computed one block of rows at a time and
+    thresholded immediately, so peak memory is ``block_rows * n`` floats
+    instead of ``n * n``. Pairs come out in row-major order.
+
+    A torch tensor (e.g. fp16 embeddings left on the GPU) is handled by
+    ``_similar_pairs_torch`` without copying it to the host.  NumPy input is
+    multiplied in float32: half the bandwidth of float64, while float16 has
+    no BLAS kernel on CPU and would be far slower.  When faiss is installed,
+    NumPy input goes through ``_similar_pairs_faiss`` instead.
+    """
+    if not isinstance(embs, np.ndarray):
+        return _similar_pairs_torch(embs, threshold, block_rows)
+
+    embs = np.ascontiguousarray(embs, dtype=np.float32)
+    if faiss is not None:
+        return _similar_pairs_faiss(embs, threshold)
+
+    pairs: list[tuple[int, int, float]] = []
+    for start in range(0, len(embs), block_rows):
+        sims = embs[start : start + block_rows] @ embs.T
+        rows, cols = np.nonzero(sims >= threshold)
+        upper = cols > rows + start
+        for r, c in zip(rows[upper].tolist(), cols[upper].tolist()):
+            pairs.append((r + start, c, float(sims[r, c])))
+    return pairs
 
 
 def _detect_near_duplicates(
@@ -304,7 +582,11 @@ def _detect_near_duplicates(
     embeddings: np.ndarray,
     texts: list[str],
 ) -> dict[int, str]:
-    """Flag facility pairs with nearly identical free-form text."""
+    """Flag facility pairs with nearly identical free-form text.
+
+    Returns:
+        Descriptions keyed by row position in ``df``.
+    """
     anomalies: dict[int, str] = {}
 
     has_text = [i for i in range(len(embeddings)) if texts[i].strip()]
@@ -312,60 +594,95 @@ def _detect_near_duplicates(
         return {}
 
     sub_embs = embeddings[has_text]
-    sim_matrix = sub_embs @ sub_embs.T
-
-    seen_pairs: set[tuple[int, int]] = set()
-
-    for a_local in range(len(has_text)):
-        for b_local in range(a_local + 1, len(has_text)):
-            if sim_matrix[a_local, b_local] >= _DUPLICATE_THRESHOLD:
-                a_orig = has_text[a_local]
-                b_orig = has_text[b_local]
-
-                id_a = df.iloc[a_orig].get("pk_unique_id")
-                id_b = df.iloc[b_orig].get("pk_unique_id")
-                if id_a == id_b:
-                    continue
-
-                pair = (min(a_orig, b_orig), max(a_orig, b_orig))
-                if pair in seen_pairs:
-                    continue
-                seen_pairs.add(pair)
-
-                name_a = df.iloc[a_orig].get("name", "?")
-                name_b = df.iloc[b_orig].get("name", "?")
-                sim_val = float(sim_matrix[a_local, b_local])
-
-                idx_a = df.index[a_orig]
-                idx_b = df.index[b_orig]
-
-                desc_a = (
-                    f"Near-duplicate capability profile with '{name_b}' "
-                    f"(ID {id_b}, similarity: {sim_val:.2f}) — "
-                    f"may indicate duplicated or copy-pasted data"
-                )
-                desc_b = (
-                    f"Near-duplicate capability profile with '{name_a}' "
-                    f"(ID {id_a}, similarity: {sim_val:.2f}) — "
-                    f"may indicate duplicated or copy-pasted data"
-                )
-
-                anomalies.setdefault(idx_a, "")
-                if anomalies[idx_a]:
-                    anomalies[idx_a] += "; " + desc_a
-                else:
-                    anomalies[idx_a] = desc_a
-
-                anomalies.setdefault(idx_b, "")
-                if anomalies[idx_b]:
-                    anomalies[idx_b] += "; " + desc_b
-                else:
-                    anomalies[idx_b] = desc_b
+
+    # Pull the columns quoted in the descriptions out once, rather than
+    # building a row Series per lookup inside the pair loop
+    def column_values(column: str, default: object) -> np.ndarray:
+        if column not in df.columns:
+            return np.full(len(df), default, dtype=object)
+        return df[column].to_numpy(dtype=object)
+
+    ids = column_values("pk_unique_id", None)
+    names = column_values("name", "?")
+
+    for a_local, b_local, sim_val in _similar_pairs(sub_embs, _DUPLICATE_THRESHOLD):
+        a_orig = has_text[a_local]
+        b_orig = has_text[b_local]
+
+        id_a = ids[a_orig]
+        id_b = ids[b_orig]
+        if id_a == id_b:
+            continue
+
+        name_a = names[a_orig]
+        name_b = names[b_orig]
+
+        desc_a = (
+            f"Near-duplicate capability profile with '{name_b}' "
+            f"(ID {id_b}, similarity: {sim_val:.2f}) — "
+            f"may indicate duplicated or copy-pasted data"
+        )
+        desc_b = (
+            f"Near-duplicate capability profile with '{name_a}' "
+            f"(ID {id_a}, similarity: {sim_val:.2f}) — "
+            f"may indicate duplicated or copy-pasted data"
+        )
+
+        anomalies.setdefault(a_orig, "")
+        if anomalies[a_orig]:
+            anomalies[a_orig] += "; " + desc_a
+        else:
+            anomalies[a_orig] = desc_a
+
+        anomalies.setdefault(b_orig, "")
+        if anomalies[b_orig]:
+            anomalies[b_orig] += "; " + desc_b
+        else:
+            anomalies[b_orig] = desc_b
 
     return anomalies
 
 
-def _run_embedding_checks(df: pd.DataFrame) -> pd.DataFrame:
+def _merge_anomaly_descs(
+    df: pd.DataFrame, anomaly_dicts: tuple[dict[int, str], ...]
+) -> int:
+    """Append per-row anomaly descriptions to ``df["anomaly_desc"]`` in place.
+
+    Each dict (row position -> description) is scattered into a positional
+    array and merged in one vectorized pass: rows that already have a
+    description get "; "-joined, the others take the new one.  Working by
+    position keeps this correct for frames with a non-unique index.
+
+    Returns:
+        Number of rows that had no description before the merge.
+    """
+    descs = df["anomaly_desc"].to_numpy(dtype=object).copy()
+    new_flags = 0
+    for anomaly_dict in anomaly_dicts:
+        if not anomaly_dict:
+            continue
+        new = np.full(len(df), None, dtype=object)
+        new[list(anomaly_dict)] = list(anomaly_dict.values())
+
+        has_new = pd.notna(new)
+        has_existing = pd.notna(descs) & (descs != "")
+        both = has_new & has_existing
+        only_new = has_new & ~has_existing
+        descs[both] = (
+            pd.Series(descs[both], dtype=object)
+            .str.cat(pd.Series(new[both], dtype=object), sep="; ")
+            .to_numpy(dtype=object)
+        )
+        descs[only_new] = new[only_new]
+        new_flags += int(only_new.sum())
+
+    df["anomaly_desc"] = descs
+    return new_flags
+
+
+def _run_embedding_checks(
+    df: pd.DataFrame, parsed: dict[str, pd.Series] | None = None
+) -> pd.DataFrame:
     """Run embedding-based anomaly detection (peer outliers + near-duplicates).
 
     Merges results into the existing `anomaly_desc` column.
@@ -380,25 +697,34 @@ def _run_embedding_checks(df: pd.DataFrame) -> pd.DataFrame:
         )
         return df
 
-    texts = [_build_text(row) for _, row in df.iterrows()]
-
-    logger.info("Computing embeddings for %d facilities...", len(texts))
-    model = SentenceTransformer(_MODEL_NAME)
-    embeddings = model.encode(texts, show_progress_bar=False, normalize_embeddings=True)
+    texts = _build_texts(df, parsed)
+
+    device = _select_device()
+    logger.info("Computing embeddings for %d facilities on %s...", len(texts), device)
+    model = SentenceTransformer(_MODEL_NAME, device=device)
+    encode_kwargs = {
+        "batch_size": _ENCODE_BATCH_SIZE,
+        "show_progress_bar": False,
+        "normalize_embeddings": True,
+    }
+    if device == "cuda":
+        # Keep the embeddings on the GPU in fp16 for the pairwise matmul;
+        # the peer-outlier check gets a float32 host copy
+        device_embeddings = model.encode(
+            texts, convert_to_tensor=True, **encode_kwargs
+        ).half()
+        embeddings = device_embeddings.float().cpu().numpy()
+    else:
+        embeddings = model.encode(
+            texts, convert_to_numpy=True, **encode_kwargs
+        ).astype(np.float32, copy=False)
+        device_embeddings = embeddings
     logger.info("Embeddings computed (%d × %d)", *embeddings.shape)
 
     outlier_anomalies = _detect_peer_outliers(df, embeddings, texts)
-    duplicate_anomalies = _detect_near_duplicates(df, embeddings, texts)
+    duplicate_anomalies = _detect_near_duplicates(df, device_embeddings, texts)
 
-    new_flags = 0
-    for anomaly_dict in (outlier_anomalies, duplicate_anomalies):
-        for idx, desc in anomaly_dict.items():
-            existing = df.at[idx, "anomaly_desc"]
-            if existing and pd.notna(existing):
-                df.at[idx, "anomaly_desc"] = f"{existing}; {desc}"
-            else:
-                df.at[idx, "anomaly_desc"] = desc
-                new_flags += 1
+    new_flags = _merge_anomaly_descs(df, (outlier_anomalies, duplicate_anomalies))
 
     total_flagged = df["anomaly_desc"].notna().sum()
     logger.info(
@@ -428,42 +754,14 @@ def run_anomaly_detection(df: pd.DataFrame) -> pd.DataFrame:
 
     Returns the DataFrame with the new column.
     """
+    # Parse the list columns once for both phases
+    parsed = _parse_list_columns(df)
+
     # ── Phase 1: Rule-based detection ─────────────────────────────────
-    anomaly_descs: list[str | None] = []
-    rule_count = 0
-
-    for _, row in df.iterrows():
-        name = str(row.get("name", ""))
-        facility_type = row.get("facilityTypeId")
-        if pd.isna(facility_type):
-            facility_type = None
-
-        specialties = safe_parse_list(row.get("specialties"))
-        procedures = safe_parse_list(row.get("procedure"))
-        equipment = safe_parse_list(row.get("equipment"))
-        capabilities = safe_parse_list(row.get("capability"))
-
-        cap_val = row.get("capacity")
-        capacity = float(cap_val) if cap_val is not None and not pd.isna(cap_val) else None
-
-        doc_val = row.get("numberDoctors")
-        num_doctors = float(doc_val) if doc_val is not None and not pd.isna(doc_val) else None
-
-        desc = _detect_anomalies_for_row(
-            name=name,
-            facility_type=facility_type,
-            specialties=specialties,
-            procedures=procedures,
-            equipment=equipment,
-            capabilities=capabilities,
-            capacity=capacity,
-            num_doctors=num_doctors,
-        )
-        anomaly_descs.append(desc)
-        if desc is not None:
-            rule_count += 1
+    anomaly_descs = _detect_rule_anomalies_parallel(df, parsed)
+    rule_count = int(sum(desc is not None for desc in anomaly_descs))
 
-    df["anomaly_desc"] = anomaly_descs
+    df["anomaly_desc"] = anomaly_descs.tolist()
 
     logger.info(
         "Rule-based detection: %d/%d facilities flagged",
@@ -472,6 +770,6 @@ def run_anomaly_detection(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # ── Phase 2: Embedding-based detection ────────────────────────────
-    df = _run_embedding_checks(df)
+    df = _run_embedding_checks(df, parsed)
 
     return df
@@ -11,6 +11,7 @@ This is a fallback for when LLM-based extraction (llm_extraction.py) is unavaila
 from __future__ import annotations
 
 import ast
+import json
 import logging
 import re
 from typing import Any
@@ -73,19 +74,82 @@ _PROCEDURE_EQUIPMENT_JUNK: list[re.Pattern] = [
 ]
 
 
+# Patterns that are just an anchored literal ending in a colon, e.g. ^Phone:
+_LITERAL_PREFIX = re.compile(r"\^[A-Za-z ]+:")
+
+
+def _split_patterns(
+    patterns: list[re.Pattern],
+) -> tuple[tuple[str, ...], re.Pattern]:
+    """Split anchored junk patterns into literal prefixes and one fused regex.
+
+    Literal ``^Prefix:`` patterns become lowercase prefixes for a single
+    ``str.startswith(tuple)`` check; the rest (word boundaries, optional
+    characters, alternations) are combined into one alternation so they are
+    scanned in a single pass.
+    """
+    prefixes = tuple(
+        pat.pattern[1:].lower()
+        for pat in patterns
+        if _LITERAL_PREFIX.fullmatch(pat.pattern)
+    )
+    rest = "|".join(
+        f"(?:{pat.pattern})"
+        for pat in patterns
+        if not _LITERAL_PREFIX.fullmatch(pat.pattern)
+    )
+    return prefixes, re.compile(rest or "(?!)", re.IGNORECASE)
+
+
+_CAPABILITY_JUNK_PREFIXES, _CAPABILITY_JUNK_RE = _split_patterns(
+    _CAPABILITY_JUNK_PATTERNS
+)
+_PROCEDURE_EQUIPMENT_JUNK_PREFIXES, _PROCEDURE_EQUIPMENT_JUNK_RE = _split_patterns(
+    _PROCEDURE_EQUIPMENT_JUNK
+)
+
+
 # ── Helpers ──────────────────────────────────────────────────────────
 
+def _parse_json_str_list(s: str) -> list[str] | None:
+    """Parse a plain list of strings with ``json.loads`` when it is safe to.
+
+    Single-quoted Python lists are turned into JSON by flipping the quotes,
+    which only preserves meaning when the text has no double quotes and no
+    backslash escapes (the two languages escape differently).  Anything that
+    is not a list of strings (numbers, null/true, nested values) returns None
+    so the caller falls back to ``ast.literal_eval``.
+    """
+    if not s.startswith("[") or "\\" in s:
+        return None
+    text = s if '"' in s else s.replace("'", '"')
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(parsed, list) or not all(isinstance(x, str) for x in parsed):
+        return None
+    return parsed
+
+
 def safe_parse_list(raw: Any) -> list[str]:
     """Parse a cell value that looks like a Python list literal into an actual list.
 
     Handles: Python list literals ['a', 'b'], JSON arrays, null, NaN,
     empty strings, "[]", "nan", "None", "null", and malformed strings.
+    Values that are already lists (as left by ``clean_freeform_columns``)
+    are only normalized, not re-parsed.
     """
+    if isinstance(raw, list):
+        return [str(item).strip() for item in raw if str(item).strip()]
     if raw is None or (isinstance(raw, float) and pd.isna(raw)):
         return []
     s = str(raw).strip()
     if s in ("", "[]", "nan", "None", "null"):
         return []
+    fast = _parse_json_str_list(s)
+    if fast is not None:
+        return [item.strip() for item in fast if item.strip()]
     try:
         parsed = ast.literal_eval(s)
         if isinstance(parsed, list):
@@ -105,19 +169,50 @@ def list_to_csv_str(items: list[str]) -> str:
 def _is_junk_capability(entry: str) -> bool:
     """Return True if a capability entry is address/contact/meta junk."""
     s = entry.strip()
-    for pat in _CAPABILITY_JUNK_PATTERNS:
-        if pat.search(s):
-            return True
-    return False
+    return (
+        s.lower().startswith(_CAPABILITY_JUNK_PREFIXES)
+        or _CAPABILITY_JUNK_RE.match(s) is not None
+    )
 
 
 def _is_junk_proc_equip(entry: str) -> bool:
     """Return True if a procedure/equipment entry is address/contact junk."""
     s = entry.strip()
-    for pat in _PROCEDURE_EQUIPMENT_JUNK:
-        if pat.search(s):
-            return True
-    return False
+    return (
+        s.lower().startswith(_PROCEDURE_EQUIPMENT_JUNK_PREFIXES)
+        or _PROCEDURE_EQUIPMENT_JUNK_RE.match(s) is not None
+    )
+
+
+def _drop_junk_entries(
+    values: pd.Series, junk_prefixes: tuple[str, ...], junk_re: re.Pattern
+) -> tuple[pd.Series, int, int]:
+    """Parse a list column and drop junk entries.
+
+    An entry is junk if it starts with one of ``junk_prefixes`` (case
+    insensitive) or matches ``junk_re``.  Entries are exploded into one flat
+    Series so both checks run over all of them in single vectorized calls,
+    then regrouped per row.
+
+    Returns:
+        (cleaned column of lists, entries before, entries kept)
+    """
+    parsed = pd.Series(values.map(safe_parse_list).to_numpy(dtype=object))
+    entries = parsed.explode().dropna()
+    is_junk = entries.str.lower().str.startswith(junk_prefixes) | entries.str.match(
+        junk_re
+    )
+    keep = ~is_junk.to_numpy(dtype=bool)
+    kept = entries[keep].groupby(level=0, sort=False).agg(list)
+
+    cleaned: list[list[str]] = [[] for _ in range(len(values))]
+    for pos, items in zip(kept.index.tolist(), kept.tolist()):
+        cleaned[pos] = items
+    return (
+        pd.Series(cleaned, index=values.index, dtype=object),
+        len(entries),
+        int(keep.sum()),
+    )
 
 
 # ── Public API ────────────────────────────────────────────────────────
@@ -128,23 +223,17 @@ def clean_freeform_columns(df: pd.DataFrame) -> pd.DataFrame:
     The capability column is the most polluted (addresses, phone numbers, LinkedIn
     metadata, etc.). Procedure and equipment columns get a lighter cleaning pass.
 
-    Returns a copy of the DataFrame with cleaned columns.
+    Returns a copy of the DataFrame with cleaned columns.  The cleaned
+    columns hold Python lists, so later steps skip re-parsing them;
+    ``DataFrame.to_csv`` writes them in the same ``['a', 'b']`` form as
+    ``list_to_csv_str`` (``[]`` when empty).
     """
     df = df.copy()
 
     if "capability" in df.columns:
-        before_total = 0
-        after_total = 0
-
-        def _clean_cap(raw):
-            nonlocal before_total, after_total
-            items = safe_parse_list(raw)
-            before_total += len(items)
-            cleaned = [item for item in items if not _is_junk_capability(item)]
-            after_total += len(cleaned)
-            return list_to_csv_str(cleaned)
-
-        df["capability"] = df["capability"].apply(_clean_cap)
+        df["capability"], before_total, after_total = _drop_junk_entries(
+            df["capability"], _CAPABILITY_JUNK_PREFIXES, _CAPABILITY_JUNK_RE
+        )
         logger.info(
             "Capability cleaning: removed %d junk entries, kept %d",
             before_total - after_total,
@@ -153,12 +242,10 @@ def clean_freeform_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in ("procedure", "equipment"):
         if col in df.columns:
-            def _clean_col(raw):
-                items = safe_parse_list(raw)
-                cleaned = [item for item in items if not _is_junk_proc_equip(item)]
-                return list_to_csv_str(cleaned)
-
-            df[col] = df[col].apply(_clean_col)
+            df[col], _, _ = _drop_junk_entries(
+                df[col],
+                _PROCEDURE_EQUIPMENT_JUNK_PREFIXES,
+                _PROCEDURE_EQUIPMENT_JUNK_RE,
+            )
 
     return df
-
@@ -18,13 +18,34 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from oasis.cleaning._cache import SQLiteCache
+from oasis.config import _PROJECT_DATA_DIR, _PROJECT_ROOT
 
 logger = logging.getLogger(__name__)
 
@@ -33,18 +54,16 @@ logger = logging.getLogger(__name__)
 
 GOOGLE_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
-# location_type values we consider precise enough to accept
-ACCEPTED_LOCATION_TYPES = {"ROOFTOP", "RANGE_INTERPOLATED", "GEOMETRIC_CENTER"}
-
+# location_type values we consider precise enough to accept.  Interned, as
+# are the location_type values read from responses and the cache, so the
+# membership test in the cascade resolves on identity.
+ACCEPTED_LOCATION_TYPES = frozenset(
+    sys.intern(t) for t in ("ROOFTOP", "RANGE_INTERPOLATED", "GEOMETRIC_CENTER")
+)
 
-def _find_project_root() -> Path:
-    """Find the project root (directory containing pyproject.toml or oasis_data)."""
-    current = Path(__file__).resolve().parent
-    for _ in range(10):
-        if (current / "pyproject.toml").exists() or (current / "oasis_data").exists():
-            return current
-        current = current.parent
-    return Path.cwd()
+# Geocoding requests in flight at once.  Each request is network-bound, so
+# threads overlap the round-trips; a cascade stays sequential per facility.
+MAX_CONCURRENT_REQUESTS = 16
 
 
 def _get_api_key() -> str:
@@ -58,60 +77,314 @@ def _get_api_key() -> str:
     return key
 
 
+# ── Geocode cache ─────────────────────────────────────────────────────
+
+GeocodeResult = tuple[float | None, float | None, str | None]
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a location_type so repeated values share one string object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries match."""
+    return re.sub(r"\s+", " ", query.strip().lower())
+
+
+class _GeocodeCache(SQLiteCache[GeocodeResult]):
+    """Two-tier cache of geocoding results keyed by normalized query.
+
+    Negative results (ZERO_RESULTS) are stored as all-None rows so they are
+    not re-queried either.
+    """
+
+    table = "geocode"
+    columns = ("lat REAL", "lng REAL", "location_type TEXT")
+    label = "Geocode"
+
+    @staticmethod
+    def _key(query: str) -> str:
+        return hashlib.sha1(_normalize_query(query).encode()).hexdigest()
+
+    def _decode(self, row: tuple) -> GeocodeResult:
+        lat, lng, location_type = row
+        return lat, lng, _intern(location_type)
+
+    def get(self, query: str) -> GeocodeResult | None:
+        """Return the cached result for ``query``, or None on a miss."""
+        return self._get_many([self._key(query)])[0]
+
+    def set(self, query: str, value: GeocodeResult) -> None:
+        """Store ``value`` for ``query`` in memory and on disk."""
+        self._put_many([(self._key(query), value, value)])
+
+
+def _default_cache_path() -> Path:
+    return _PROJECT_DATA_DIR / ".geocode_cache.sqlite"
+
+
+# ── Rate limiting ─────────────────────────────────────────────────────
+
+# Requests per second shared by all geocoding threads
+DEFAULT_GEOCODE_QPS = 50.0
+
+# Attempts per query for throttling / transient server errors, with
+# exponential backoff (1s, 2s, 4s, ...) between them
+MAX_GEOCODE_ATTEMPTS = 5
+_RETRYABLE_HTTP_STATUSES = {429, 500, 502, 503}
+_RETRYABLE_API_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class _RateLimiter:
+    """Thread-safe token bucket: at most ``rate`` acquisitions per second.
+
+    The bucket holds up to one second's worth of tokens for bursts; once
+    empty, callers sleep until their token has been refilled.
+    """
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._rate, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # Going negative reserves a future token for this caller
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rate_limiter() -> _RateLimiter:
+    """Return the process-wide limiter, sized from GOOGLE_GEOCODE_QPS."""
+    raw = os.environ.get("GOOGLE_GEOCODE_QPS", "").strip()
+    try:
+        rate = float(raw) if raw else DEFAULT_GEOCODE_QPS
+    except ValueError:
+        logger.warning("Ignoring invalid GOOGLE_GEOCODE_QPS=%r", raw)
+        rate = DEFAULT_GEOCODE_QPS
+    return _RateLimiter(rate if rate > 0 else DEFAULT_GEOCODE_QPS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Return the process-wide HTTP session, so connections are kept alive.
+
+    Reusing one session saves a TCP + TLS handshake per query.  The pool is
+    sized for the worker threads; the adapter only retries connection
+    errors, since throttling statuses are retried (under the rate limiter)
+    by ``_request_geocode``.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _decode_json(resp: requests.Response) -> dict:
+    """Decode a JSON response body, straight from bytes with orjson if available.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _request_geocode(query: str, api_key: str) -> dict | None:
+    """Send one rate-limited geocoding request, retrying transient failures.
+
+    HTTP 429/5xx responses and OVER_QUERY_LIMIT / UNKNOWN_ERROR statuses
+    are retried with exponential backoff, up to ``MAX_GEOCODE_ATTEMPTS``.
+
+    Returns:
+        The decoded JSON response, or None if the request failed.
+    """
+    params = {
+        "address": query,
+        "key": api_key,
+    }
+
+    for attempt in range(MAX_GEOCODE_ATTEMPTS):
+        last_attempt = attempt + 1 == MAX_GEOCODE_ATTEMPTS
+        _get_rate_limiter().acquire()
+        try:
+            resp = _get_session().get(GOOGLE_GEOCODE_URL, params=params, timeout=10)
+            if resp.status_code in _RETRYABLE_HTTP_STATUSES and not last_attempt:
+                reason = f"HTTP {resp.status_code}"
+            else:
+                resp.raise_for_status()
+                data = _decode_json(resp)
+                if data.get("status") not in _RETRYABLE_API_STATUSES or last_attempt:
+                    return data
+                reason = data.get("status")
+        except (requests.RequestException, ValueError) as e:
+            # ValueError: body is not valid JSON
+            logger.warning("Google Geocoding request failed for '%s': %s", query, e)
+            return None
+
+        wait = 2**attempt
+        logger.info(
+            "Geocoding '%s' throttled (%s), retrying in %ds", query, reason, wait
+        )
+        time.sleep(wait)
+
+    return None
+
+
 # ── Google Geocoding API call ─────────────────────────────────────────
 
 def _geocode_google(
-    query: str, api_key: str
-) -> tuple[float | None, float | None, str | None]:
+    query: str, api_key: str, cache: _GeocodeCache | None = None
+) -> GeocodeResult:
     """Call the Google Geocoding API for a single query.
 
+    With a ``cache``, a previously seen query (after normalization) is
+    answered without a request.  Successful results and ZERO_RESULTS are
+    cached; request failures and other API statuses are not, so they are
+    retried on the next run.
+
     Returns:
         (latitude, longitude, location_type) or (None, None, None) on
         error / no results.  location_type is one of ROOFTOP,
         RANGE_INTERPOLATED, GEOMETRIC_CENTER, APPROXIMATE, or None.
     """
-    params = {
-        "address": query,
-        "key": api_key,
-    }
-
-    try:
-        resp = requests.get(GOOGLE_GEOCODE_URL, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-
-        if data.get("status") == "OK" and data.get("results"):
-            result = data["results"][0]
-            geometry = result.get("geometry", {})
-            location = geometry.get("location", {})
-            location_type = geometry.get("location_type")
-
-            lat = float(location["lat"])
-            lng = float(location["lng"])
-            return lat, lng, location_type
-
-        if data.get("status") == "ZERO_RESULTS":
-            logger.debug("No results for query: '%s'", query)
-        elif data.get("status") != "OK":
-            logger.warning(
-                "Google Geocoding API status '%s' for '%s': %s",
-                data.get("status"),
-                query,
-                data.get("error_message", ""),
-            )
+    if cache is not None:
+        cached = cache.get(query)
+        if cached is not None:
+            return cached
 
+    data = _request_geocode(query, api_key)
+    if data is None:
         return None, None, None
 
-    except requests.RequestException as e:
-        logger.warning("Google Geocoding request failed for '%s': %s", query, e)
-        return None, None, None
+    if data.get("status") == "OK" and data.get("results"):
+        result = data["results"][0]
+        geometry = result.get("geometry", {})
+        location = geometry.get("location", {})
+        location_type = _intern(geometry.get("location_type"))
+
+        lat = float(location["lat"])
+        lng = float(location["lng"])
+        if cache is not None:
+            cache.set(query, (lat, lng, location_type))
+        return lat, lng, location_type
+
+    if data.get("status") == "ZERO_RESULTS":
+        logger.debug("No results for query: '%s'", query)
+        if cache is not None:
+            cache.set(query, (None, None, None))
+    elif data.get("status") != "OK":
+        logger.warning(
+            "Google Geocoding API status '%s' for '%s': %s",
+            data.get("status"),
+            query,
+            data.get("error_message", ""),
+        )
+
+    return None, None, None
 
 
 # ── Cascade logic ────────────────────────────────────────────────────
 
+CascadeResult = tuple[float | None, float | None, str | None, str | None, str]
+
+
+# Queries shorter than this (after stripping) are not worth a request
+_MIN_QUERY_LENGTH = 5
+# Placeholder values that leak into names / addresses
+_PLACEHOLDER_QUERIES = {"n/a", "none", "unknown", "tbd", "not available"}
+_HAS_LETTER = re.compile(r"[A-Za-z]")
+
+
+def _is_plausible_query(query: str) -> bool:
+    """Cheap check that a query could geocode to anything at all.
+
+    Rejects blank and very short strings, strings without a single letter
+    (pure numbers, punctuation) and common placeholders such as "N/A", so
+    they cost no request or quota.
+    """
+    q = query.strip()
+    return (
+        len(q) >= _MIN_QUERY_LENGTH
+        and _HAS_LETTER.search(q) is not None
+        and q.lower() not in _PLACEHOLDER_QUERIES
+    )
+
+
+def _candidate_queries(queries: list[str]) -> list[str]:
+    """Return the candidates worth sending, in cascade order.
+
+    A candidate equal to an earlier one after normalization is dropped: it
+    would get the same (cached) answer, which cannot change the outcome.
+    """
+    candidates = []
+    seen: set[str] = set()
+    for query in queries:
+        if not query or not _is_plausible_query(query):
+            continue
+        norm = _normalize_query(query)
+        if norm not in seen:
+            seen.add(norm)
+            candidates.append(query)
+    return candidates
+
+
+class _Cascade:
+    """Cascade state for one facility, fed one geocoding result at a time.
+
+    Accepts the first precise result; otherwise remembers the first
+    APPROXIMATE result as a fallback.
+    """
+
+    __slots__ = ("accepted", "approx")
+
+    def __init__(self) -> None:
+        self.accepted: CascadeResult | None = None
+        self.approx: CascadeResult | None = None
+
+    def offer(self, query: str, result: GeocodeResult) -> bool:
+        """Record the result for ``query``; True once a precise one is accepted."""
+        lat, lng, location_type = result
+
+        if lat is not None and location_type in ACCEPTED_LOCATION_TYPES:
+            # Precise result — accept immediately
+            self.accepted = (lat, lng, location_type, query, "ok")
+            return True
+
+        if lat is not None and self.approx is None:
+            # First APPROXIMATE — remember it as fallback
+            self.approx = (lat, lng, location_type, query, "approximate")
+        return False
+
+    def result(self) -> CascadeResult:
+        if self.accepted is not None:
+            return self.accepted
+        # Exhausted all candidates — fall back to APPROXIMATE if available
+        if self.approx is not None:
+            return self.approx
+        # All failed entirely
+        return None, None, None, None, "error"
+
+
 def _geocode_cascade(
-    queries: list[str], api_key: str
-) -> tuple[float | None, float | None, str | None, str | None, str]:
+    queries: list[str], api_key: str, cache: _GeocodeCache | None = None
+) -> CascadeResult:
     """Try each candidate query in order; accept the first precise result.
 
     If no precise result is found, falls back to the first APPROXIMATE
@@ -121,40 +394,225 @@ def _geocode_cascade(
         (lat, long, location_type, query_used, status)
         status is "ok" | "approximate" | "error"
     """
-    # Store the first APPROXIMATE result as a fallback
-    approx_lat: float | None = None
-    approx_lng: float | None = None
-    approx_location_type: str | None = None
-    approx_query: str | None = None
+    cascade = _Cascade()
+    for query in _candidate_queries(queries):
+        if cascade.offer(query, _geocode_google(query, api_key, cache)):
+            break
+    return cascade.result()
+
+
+def _geocode_cascades(
+    query_lists: dict[int, list[str]],
+    api_key: str,
+    cache: _GeocodeCache,
+    executor: ThreadPoolExecutor,
+) -> Iterator[tuple[int, CascadeResult]]:
+    """Run many cascades together, sending each distinct query only once.
+
+    The cascades advance in waves: wave k collects the k-th candidate of
+    every still-unresolved facility, geocodes the distinct queries of that
+    wave concurrently, and feeds the results back.  Each facility sees
+    exactly the queries ``_geocode_cascade`` would have sent, in the same
+    order, but a query shared by many facilities (e.g. "Kumasi, Ghana")
+    costs one request.
+
+    Yields:
+        (key, result) for each facility as soon as its cascade finishes.
+    """
+    candidates = {key: _candidate_queries(q) for key, q in query_lists.items()}
+    cascades = {key: _Cascade() for key in candidates}
 
-    for query in queries:
-        if not query or not query.strip():
-            continue
+    pending = []
+    for key, queries in candidates.items():
+        if queries:
+            pending.append(key)
+        else:
+            yield key, cascades[key].result()
+
+    step = 0
+    while pending:
+        wave = {key: candidates[key][step] for key in pending}
+        # One request per normalized query (the cache key)
+        distinct = {_normalize_query(query): query for query in wave.values()}
+        fetched = dict(
+            zip(
+                distinct,
+                executor.map(
+                    lambda query: _geocode_google(query, api_key, cache),
+                    distinct.values(),
+                ),
+            )
+        )
 
-        lat, lng, location_type = _geocode_google(query, api_key)
+        still_pending = []
+        for key in pending:
+            query = wave[key]
+            done = cascades[key].offer(query, fetched[_normalize_query(query)])
+            if done or step + 1 == len(candidates[key]):
+                yield key, cascades[key].result()
+            else:
+                still_pending.append(key)
+        pending = still_pending
+        step += 1
+
+
+def _is_final(result: CascadeResult, queries: list[str], cache: _GeocodeCache) -> bool:
+    """Return True if a rerun would give the same result for this facility.
+
+    That holds only if every candidate the cascade tried got a definitive
+    (cached) answer: a located result or ZERO_RESULTS.  A transient failure
+    (network error, OVER_QUERY_LIMIT, UNKNOWN_ERROR) is not cached, and a
+    retry could turn it into a better match.  For "ok" that covers the
+    candidates up to the accepted one; for "approximate" and "error" the
+    cascade ran through all of them.
+    """
+    candidates = _candidate_queries(queries)
+    if result[4] == "ok":
+        candidates = candidates[: candidates.index(result[3])]
+    return all(cache.get(query) is not None for query in candidates)
 
-        if lat is not None and location_type in ACCEPTED_LOCATION_TYPES:
-            # Precise result — accept immediately
-            return lat, lng, location_type, query, "ok"
 
-        if lat is not None and approx_lat is None:
-            # First APPROXIMATE — remember it as fallback
-            approx_lat = lat
-            approx_lng = lng
-            approx_location_type = location_type
-            approx_query = query
+# ── Public orchestrator ──────────────────────────────────────────────
 
-    # Exhausted all candidates — fall back to APPROXIMATE if available
-    if approx_lat is not None:
-        return approx_lat, approx_lng, approx_location_type, approx_query, "approximate"
+# Fields returned by _geocode_cascade, in tuple order
+_RESULT_COLUMNS = [
+    "lat",
+    "long",
+    "geocode_location_type",
+    "geocode_query_used",
+    "geocode_status",
+]
+# Output columns, in the order they are added to the frame
+_OUTPUT_COLUMNS = [
+    "lat",
+    "long",
+    "geocode_status",
+    "geocode_location_type",
+    "geocode_query_used",
+]
+
+
+def _parse_queries(raw: object) -> list[str] | None:
+    """Parse a geo_queries cell into a candidate list (None if empty)."""
+    if pd.isna(raw) or not str(raw).strip():
+        return None
+    try:
+        text = str(raw)
+        queries = orjson.loads(text) if orjson is not None else json.loads(text)
+        if not isinstance(queries, list):
+            queries = [str(queries)]
+    except (json.JSONDecodeError, TypeError):
+        queries = [str(raw)]
+    return queries
 
-    # All failed entirely
-    return None, None, None, None, "error"
 
+def _parse_query_column(values: pd.Series) -> dict[int, list[str]]:
+    """Parse a geo_queries column into candidate lists keyed by row position.
 
-# ── Public orchestrator ──────────────────────────────────────────────
+    Facilities with the same name and address share one geo_queries string,
+    so each distinct value is decoded once and reused.  Missing and empty
+    cells are left out.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = [_parse_queries(raw) for raw in uniques]
+    return {
+        pos: parsed[code]
+        for pos, code in enumerate(codes.tolist())
+        if code >= 0 and parsed[code] is not None
+    }
+
+
+# ── Checkpointing ────────────────────────────────────────────────────
+
+# Finished facilities are checkpointed in batches of this many
+CHECKPOINT_EVERY = 100
+
+_CHECKPOINT_SCHEMA = pa.schema(
+    [
+        ("pos", pa.int64()),
+        ("geo_queries", pa.string()),
+        ("lat", pa.float64()),
+        ("long", pa.float64()),
+        ("geocode_location_type", pa.string()),
+        ("geocode_query_used", pa.string()),
+        ("geocode_status", pa.string()),
+    ]
+)
+
+
+class _Checkpoint:
+    """Finished geocoding results persisted while a run is in progress.
+
+    Results are appended as small Parquet part files in a directory, each
+    written to a temporary name and renamed into place, so an interrupted
+    run leaves only complete parts behind.  Rows are keyed by position and
+    carry their geo_queries value, so a restart on changed input does not
+    reuse stale results.  Only final results are added (see ``_is_final``),
+    so facilities whose cascade hit a transient failure are retried on
+    resume.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._pending: list[tuple] = []
+        self._parts = len(list(path.glob("part-*.parquet"))) if path.exists() else 0
 
-def run_geocoding(df: pd.DataFrame) -> pd.DataFrame:
+    def load(self, raw_queries: list) -> dict[int, tuple]:
+        """Return results of an earlier run whose geo_queries still match."""
+        if not self._parts:
+            return {}
+        try:
+            done = pd.read_parquet(self._path, schema=_CHECKPOINT_SCHEMA)
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable geocoding checkpoint %s: %s", self._path, e
+            )
+            return {}
+        restored = {}
+        for pos, queries, *result in done.itertuples(index=False, name=None):
+            if pos < len(raw_queries) and str(raw_queries[pos]) == queries:
+                restored[pos] = tuple(None if pd.isna(v) else v for v in result)
+        return restored
+
+    def add(self, pos: int, queries: object, result: tuple) -> None:
+        self._pending.append((pos, str(queries), *result))
+        if len(self._pending) >= CHECKPOINT_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending results as a new part file (best effort)."""
+        if not self._pending:
+            return
+        frame = pd.DataFrame(self._pending, columns=_CHECKPOINT_SCHEMA.names)
+        part = self._path / f"part-{self._parts:05d}.parquet"
+        # Dot-prefixed, so a half-written file is never read as a part
+        tmp = self._path / f".{part.name}.tmp"
+        try:
+            self._path.mkdir(parents=True, exist_ok=True)
+            frame.to_parquet(tmp, schema=_CHECKPOINT_SCHEMA, index=False)
+            os.replace(tmp, part)
+        except OSError as e:
+            logger.warning("Could not write geocoding checkpoint %s: %s", part, e)
+            return
+        self._parts += 1
+        self._pending.clear()
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the run has completed."""
+        shutil.rmtree(self._path, ignore_errors=True)
+
+
+def default_checkpoint_path(csv_path: Path) -> Path:
+    """Checkpoint directory for a run that writes ``csv_path``."""
+    return csv_path.with_name(csv_path.name + ".partial")
+
+
+def run_geocoding(
+    df: pd.DataFrame,
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    use_cache: bool = True,
+    checkpoint_path: Path | None = None,
+) -> pd.DataFrame:
     """Geocode all facilities using cascading Google Geocoding queries.
 
     Reads the geo_queries column (JSON array of candidate queries) and adds:
@@ -165,9 +623,20 @@ def run_geocoding(df: pd.DataFrame) -> pd.DataFrame:
 
     For each facility, tries candidates in order and accepts the first
     precise result (ROOFTOP / RANGE_INTERPOLATED / GEOMETRIC_CENTER).
+    The cascades of all facilities advance together, so a query shared by
+    several facilities is sent once per run, and the distinct queries of
+    each round are geocoded concurrently on a thread pool.  Results are
+    also cached in ``oasis_data/.geocode_cache.sqlite`` across runs.
 
     Args:
         df: DataFrame with a geo_queries column (JSON array).
+        max_workers: Number of requests in flight at once.
+        use_cache: Persist results to the on-disk cache and reuse them.
+            When False, results are still shared within this run.
+        checkpoint_path: Directory to checkpoint finished facilities to.
+            If a previous run was interrupted, its results are restored
+            from here instead of being geocoded again (transient failures
+            are retried); the checkpoint is deleted once the run completes.
 
     Returns:
         DataFrame with geocoding result columns.
@@ -175,61 +644,78 @@ def run_geocoding(df: pd.DataFrame) -> pd.DataFrame:
     api_key = _get_api_key()
     df = df.copy()
 
-    # Pre-initialise output columns
-    df["lat"] = None
-    df["long"] = None
-    df["geocode_status"] = None
-    df["geocode_location_type"] = None
-    df["geocode_query_used"] = None
-
     total = len(df)
-    accepted = 0
-    approximate = 0
-    errors = 0
 
-    for idx in df.index:
-        raw = df.at[idx, "geo_queries"] if "geo_queries" in df.columns else None
+    # (lat, long, location_type, query_used, status) per row position
+    results: list[tuple] = [(None, None, None, None, "error")] * total
+    jobs = _parse_query_column(df["geo_queries"]) if "geo_queries" in df.columns else {}
 
-        # Parse candidate list
-        if pd.isna(raw) or not str(raw).strip():
-            df.at[idx, "geocode_status"] = "error"
-            errors += 1
-            continue
-
-        try:
-            queries = json.loads(str(raw))
-            if not isinstance(queries, list):
-                queries = [str(queries)]
-        except (json.JSONDecodeError, TypeError):
-            queries = [str(raw)]
-
-        lat, lng, location_type, query_used, status = _geocode_cascade(
-            queries, api_key
-        )
-
-        df.at[idx, "lat"] = lat
-        df.at[idx, "long"] = lng
-        df.at[idx, "geocode_status"] = status
-        df.at[idx, "geocode_location_type"] = location_type
-        df.at[idx, "geocode_query_used"] = query_used
-
-        if status == "ok":
-            accepted += 1
-        elif status == "approximate":
-            approximate += 1
-        else:
-            errors += 1
-
-        processed = accepted + approximate + errors
-        if processed % 50 == 0:
+    accepted = 0
+    approximate = 0
+    errors = total - len(jobs)
+
+    checkpoint = _Checkpoint(checkpoint_path) if checkpoint_path else None
+    restored: dict[int, tuple] = {}
+    if checkpoint is not None:
+        raw_queries = df["geo_queries"].tolist() if jobs else []
+        restored = checkpoint.load(raw_queries)
+        if restored:
             logger.info(
-                "Geocoding progress: %d/%d (accepted: %d, approximate: %d, errors: %d)",
-                processed,
-                total,
-                accepted,
-                approximate,
-                errors,
+                "Restored %d geocoded facilities from %s",
+                len(restored),
+                checkpoint_path,
+            )
+            jobs = {pos: q for pos, q in jobs.items() if pos not in restored}
+
+    cache = _GeocodeCache(_default_cache_path() if use_cache else None)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            finished = chain(
+                restored.items(), _geocode_cascades(jobs, api_key, cache, executor)
             )
+            for pos, result in finished:
+                results[pos] = result
+                # Results shaped by transient failures are left out so a
+                # resumed run retries them
+                if (
+                    checkpoint is not None
+                    and pos not in restored
+                    and _is_final(result, jobs[pos], cache)
+                ):
+                    checkpoint.add(pos, raw_queries[pos], result)
+
+                status = result[4]
+                if status == "ok":
+                    accepted += 1
+                elif status == "approximate":
+                    approximate += 1
+                else:
+                    errors += 1
+
+                processed = accepted + approximate + errors
+                if processed % 50 == 0:
+                    logger.info(
+                        "Geocoding progress: %d/%d (accepted: %d, approximate: %d, "
+                        "errors: %d)",
+                        processed,
+                        total,
+                        accepted,
+                        approximate,
+                        errors,
+                    )
+    finally:
+        cache.close()
+        if checkpoint is not None:
+            checkpoint.flush()
+    if checkpoint is not None:
+        checkpoint.remove()
+
+    # One column assignment per output field instead of per-cell writes
+    result_df = pd.DataFrame(
+        results, columns=_RESULT_COLUMNS, index=df.index, dtype=object
+    )
+    for col in _OUTPUT_COLUMNS:
+        df[col] = result_df[col]
 
     logger.info(
         "Geocoding complete: %d/%d accepted, %d approximate, %d errors.",
@@ -246,22 +732,26 @@ def run_geocoding(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def main() -> None:
-    """Read vf_ghana_clean.csv, geocode, and overwrite."""
+    """Read the vf_ghana_clean snapshot, geocode, and overwrite it."""
     logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(name)s | %(message)s")
 
-    root = _find_project_root()
-    csv_path = root / "vf_ghana_clean.csv"
+    from oasis.cleaning.pipeline import _load_snapshot, _save_csv, _save_snapshot
 
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Input CSV not found at {csv_path}")
+    root = _PROJECT_ROOT
+    csv_path = root / "vf_ghana_clean.csv"
 
-    df = pd.read_csv(csv_path)
-    logger.info("Loaded %d rows from %s", len(df), csv_path)
+    df, path = _load_snapshot(csv_path)
+    logger.info("Loaded %d rows from %s", len(df), path)
 
-    df = run_geocoding(df)
+    df = run_geocoding(df, checkpoint_path=default_checkpoint_path(csv_path))
 
-    df.to_csv(csv_path, index=False)
-    logger.info("Saved %d rows to %s", len(df), csv_path)
+    # Write back in the format read, so the CSV of a finished pipeline run
+    # is not shadowed by a new Parquet snapshot
+    if path == csv_path:
+        _save_csv(df, csv_path)
+    else:
+        path = _save_snapshot(df, csv_path)
+    logger.info("Saved %d rows to %s", len(df), path)
 
 
 if __name__ == "__main__":
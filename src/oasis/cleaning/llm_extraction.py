@@ -21,21 +21,37 @@ Optional: OASIS_LLM_MODEL (default: gpt-4o-mini).
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Literal, Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
+from oasis.cleaning._cache import SQLiteCache
+from oasis.config import _PROJECT_DATA_DIR
+
 logger = logging.getLogger(__name__)
 
 # ── Configuration ─────────────────────────────────────────────────────
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# HTTP statuses that mean "slow down" (529: provider overloaded)
+_THROTTLED_LLM_STATUSES = {429, 529}
+# Server-side failures worth another attempt
+_RETRYABLE_LLM_STATUSES = {500, 502, 503, 504}
+
+# LLM calls in flight at once.  Each call is a network round-trip of a few
+# seconds, so threads overlap the waits; the OpenAI client is thread-safe.
+MAX_CONCURRENT_LLM_CALLS = 20
+
 # ── Valid specialty enum (inlined from fdr hierarchy, levels 0+1) ─────
 
 VALID_SPECIALTIES: list[str] = [
@@ -130,6 +146,10 @@ class FacilityTypeInference(BaseModel):
     )
 
 
+class FacilityCleanResult(CleanedFacilityContent, FacilityTypeInference):
+    """Structured output for Steps 4 and 5 answered in a single call."""
+
+
 # ── Prompts ──────────────────────────────────────────────────────────
 
 CONTENT_CLEANING_SYSTEM_PROMPT = """\
@@ -192,6 +212,57 @@ commercial-sounding names, no government affiliation.
 If insufficient evidence for either field, return null for that field.
 """
 
+# Steps 4 and 5 in one request: the two prompts share all their facility
+# context, so one call per facility replaces two.
+COMBINED_SYSTEM_PROMPT = (
+    CONTENT_CLEANING_SYSTEM_PROMPT
+    + "\n---\n\nIN THE SAME RESPONSE, ALSO CLASSIFY THE FACILITY.\n"
+    + FIELD_INFERENCE_SYSTEM_PROMPT
+)
+
+
+# ── Response cache ───────────────────────────────────────────────────
+
+
+class _LLMCache(SQLiteCache[str]):
+    """Two-tier cache of parsed LLM responses keyed by the full request.
+
+    The key hashes the model, the response schema and both prompts, so any
+    change to the prompts or model is a miss.  Responses are stored as the
+    parsed model's JSON.
+    """
+
+    table = "llm"
+    columns = ("response_model TEXT", "response TEXT")
+    label = "LLM"
+
+    @staticmethod
+    def key(
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        response_model: type[BaseModel],
+    ) -> str:
+        parts = (model, response_model.__name__, system_prompt, user_prompt)
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _decode(self, row: tuple) -> str:
+        return row[1]
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response JSON for ``key``, or None on a miss."""
+        return self._get_many([key])[0]
+
+    def set(self, key: str, response_model: type[BaseModel], response: str) -> None:
+        """Store the response JSON for ``key`` in memory and on disk."""
+        self._put_many([(key, response, (response_model.__name__, response))])
+
+
+def _open_cache(use_cache: bool) -> _LLMCache:
+    """Open the on-disk response cache, or a memory-only one if disabled."""
+    path = _PROJECT_DATA_DIR / ".llm_cache.sqlite"
+    return _LLMCache(path if use_cache else None)
+
 
 # ── OpenAI client helper ─────────────────────────────────────────────
 
@@ -215,11 +286,32 @@ def get_openai_client():
     return OpenAI(api_key=api_key)
 
 
-def call_llm_structured(client, system_prompt: str, user_prompt: str, response_model: type[BaseModel], max_retries: int = 3):
-    """Call OpenAI with structured output and exponential backoff retry."""
+def call_llm_structured(
+    client,
+    system_prompt: str,
+    user_prompt: str,
+    response_model: type[BaseModel],
+    max_retries: int = 3,
+    cache: _LLMCache | None = None,
+):
+    """Call OpenAI with structured output and exponential backoff retry.
+
+    With a ``cache``, a previously seen request is answered from it without
+    calling the API; usage is then None.
+    """
     model = os.environ.get("OASIS_LLM_MODEL", DEFAULT_MODEL)
 
+    key = None
+    if cache is not None:
+        key = _LLMCache.key(model, system_prompt, user_prompt, response_model)
+        cached = cache.get(key)
+        if cached is not None:
+            return response_model.model_validate_json(cached), None
+
+    from openai import APIStatusError, RateLimitError
+
     for attempt in range(max_retries):
+        last_attempt = attempt == max_retries - 1
         try:
             completion = client.beta.chat.completions.parse(
                 model=model,
@@ -230,6 +322,8 @@ def call_llm_structured(client, system_prompt: str, user_prompt: str, response_m
                 response_format=response_model,
             )
             result = completion.choices[0].message.parsed
+            if key is not None and result is not None:
+                cache.set(key, response_model, result.model_dump_json())
             # Track token usage
             usage = completion.usage
             if usage:
@@ -240,17 +334,24 @@ def call_llm_structured(client, system_prompt: str, user_prompt: str, response_m
                     usage.total_tokens,
                 )
             return result, usage
-        except Exception as e:
-            if "rate_limit" in str(e).lower() or "429" in str(e):
+        except APIStatusError as e:
+            status = e.status_code
+            if isinstance(e, RateLimitError) or status in _THROTTLED_LLM_STATUSES:
                 wait = 2 ** attempt
-                logger.warning("Rate limited, retrying in %ds...", wait)
+                logger.warning("Rate limited (HTTP %d), retrying in %ds...", status, wait)
                 time.sleep(wait)
                 continue
-            if attempt < max_retries - 1:
-                logger.warning("LLM call failed (attempt %d): %s", attempt + 1, e)
-                time.sleep(1)
-                continue
-            raise
+            if status not in _RETRYABLE_LLM_STATUSES or last_attempt:
+                # Client errors (bad request, auth, ...) will not succeed on retry
+                raise
+            logger.warning("LLM call failed (attempt %d): %s", attempt + 1, e)
+            time.sleep(1)
+        except Exception as e:
+            # Connection errors, timeouts, unparseable responses
+            if last_attempt:
+                raise
+            logger.warning("LLM call failed (attempt %d): %s", attempt + 1, e)
+            time.sleep(1)
 
     raise RuntimeError(f"LLM call failed after {max_retries} retries")
 
@@ -258,33 +359,73 @@ def call_llm_structured(client, system_prompt: str, user_prompt: str, response_m
 # ── Step 4: Content Classification & Reclassification ─────────────────
 
 
-def _build_facility_user_prompt(row: pd.Series) -> str:
-    """Build the user prompt for a single facility."""
-    parts = [f"Facility: {row.get('name', 'Unknown')}"]
+def _column_values(df: pd.DataFrame, col: str, default=None) -> list:
+    """Return a column as a plain list, or ``default`` per row if it is absent."""
+    if col in df.columns:
+        return df[col].tolist()
+    return [default] * len(df)
+
+
+def _has_items(value) -> bool:
+    """Return True for a non-empty list-like cell (False for None / NaN)."""
+    return hasattr(value, "__len__") and len(value) > 0
+
+
+def _has_text(value) -> bool:
+    """Return True for a non-empty string cell (False for None / NaN)."""
+    return isinstance(value, str) and bool(value)
+
+
+def _facility_context(name, description, org_description) -> list[str]:
+    """Prompt lines identifying a facility: its name and descriptions."""
+    parts = [f"Facility: {name}"]
+    if _has_text(description):
+        parts.append(f"Description: {description}")
+    if _has_text(org_description):
+        parts.append(f"Organization Description: {org_description}")
+    return parts
 
-    desc = row.get("description")
-    if desc:
-        parts.append(f"Description: {desc}")
 
-    org_desc = row.get("organizationDescription")
-    if org_desc:
-        parts.append(f"Organization Description: {org_desc}")
+# List columns rewritten by Step 4, in prompt order
+_CONTENT_COLUMNS = ("specialties", "procedure", "equipment", "capability")
 
-    for col in ("specialties", "procedure", "equipment", "capability"):
-        items = row.get(col, [])
+
+def _build_facility_user_prompt(
+    name="Unknown", description=None, org_description=None, **content
+) -> str:
+    """Build the user prompt for a single facility.
+
+    ``content`` maps list columns (see ``_CONTENT_COLUMNS``) to their
+    current entries.
+    """
+    parts = _facility_context(name, description, org_description)
+    for col, items in content.items():
         if items:
             parts.append(f"Current {col}: {items}")
-
     return "\n".join(parts)
 
 
-def classify_and_reclassify(df: pd.DataFrame) -> pd.DataFrame:
+def classify_and_reclassify(
+    df: pd.DataFrame,
+    max_workers: int = MAX_CONCURRENT_LLM_CALLS,
+    use_cache: bool = True,
+    infer_types: bool = False,
+) -> pd.DataFrame:
     """Step 4: LLM-based content classification, filtering, and reclassification.
 
     For each facility, sends all content to the LLM to:
     1. Filter out non-medical entries
     2. Reclassify misplaced entries
     3. Rewrite vague entries into clear statements
+
+    With ``infer_types``, the same call also fills a missing facilityTypeId /
+    operatorTypeId (Step 5's LLM fallback), so no facility needs a second
+    request.  Facilities with no content but a missing type are then sent
+    too, and only their type fields are taken from the response.
+
+    Facilities are sent concurrently, at most ``max_workers`` at a time.
+    Responses are cached in ``oasis_data/.llm_cache.sqlite`` (unless
+    ``use_cache`` is False), so re-running on unchanged data makes no calls.
     """
     client = get_openai_client()
     df = df.copy()
@@ -293,38 +434,82 @@ def classify_and_reclassify(df: pd.DataFrame) -> pd.DataFrame:
     total_completion_tokens = 0
     processed = 0
     skipped = 0
-
-    for idx in df.index:
-        row = df.loc[idx]
-
+    types_inferred = 0
+
+    # Plain per-column lists, zipped row by row (as itertuples does) instead
+    # of materializing a Series per row with df.loc
+    names = _column_values(df, "name", "Unknown")
+    descriptions = _column_values(df, "description")
+    org_descriptions = _column_values(df, "organizationDescription")
+    content = {col: _column_values(df, col, []) for col in _CONTENT_COLUMNS}
+    cleaned = {col: list(values) for col, values in content.items()}
+
+    if infer_types:
+        system_prompt, response_model = COMBINED_SYSTEM_PROMPT, FacilityCleanResult
+        facility_types = np.array(_column_values(df, "facilityTypeId"), dtype=object)
+        operator_types = np.array(_column_values(df, "operatorTypeId"), dtype=object)
+        needs_facility = pd.isna(facility_types)
+        needs_operator = pd.isna(operator_types)
+        needs_types = needs_facility | needs_operator
+    else:
+        system_prompt, response_model = CONTENT_CLEANING_SYSTEM_PROMPT, CleanedFacilityContent
+        needs_types = np.zeros(len(df), dtype=bool)
+
+    # Position -> user prompt, for every facility with something to clean
+    # (or, with infer_types, a type to infer)
+    prompts: dict[int, str] = {}
+    has_text = np.zeros(len(df), dtype=bool)
+    for pos, (name, desc, org_desc, *items) in enumerate(
+        zip(names, descriptions, org_descriptions, *content.values())
+    ):
         # Skip facilities with no content to clean
-        has_content = any(
-            len(row.get(col, [])) > 0
-            for col in ("specialties", "procedure", "equipment", "capability")
-        )
-        has_desc = bool(row.get("description")) or bool(row.get("organizationDescription"))
+        has_content = any(_has_items(values) for values in items)
+        has_desc = _has_text(desc) or _has_text(org_desc)
+        has_text[pos] = has_content or has_desc
 
-        if not has_content and not has_desc:
+        if not has_text[pos] and not needs_types[pos]:
             skipped += 1
             continue
 
-        user_prompt = _build_facility_user_prompt(row)
+        prompts[pos] = _build_facility_user_prompt(
+            name, desc, org_desc, **dict(zip(_CONTENT_COLUMNS, items))
+        )
 
-        try:
-            result, usage = call_llm_structured(
+    cache = _open_cache(use_cache)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                call_llm_structured,
                 client,
-                CONTENT_CLEANING_SYSTEM_PROMPT,
+                system_prompt,
                 user_prompt,
-                CleanedFacilityContent,
-            )
+                response_model,
+                cache=cache,
+            ): pos
+            for pos, user_prompt in prompts.items()
+        }
+        for future in as_completed(futures):
+            pos = futures[future]
+            try:
+                result, usage = future.result()
+            except Exception as e:
+                logger.error("Step 4 failed for facility '%s': %s", names[pos], e)
+                # Keep original data on failure
+                continue
 
-            # Validate specialties against allowed list
-            result.specialties = [s for s in result.specialties if s in VALID_SPECIALTIES]
+            if has_text[pos]:
+                # Validate specialties against allowed list
+                result.specialties = [s for s in result.specialties if s in VALID_SPECIALTIES]
 
-            df.at[idx, "specialties"] = result.specialties
-            df.at[idx, "procedure"] = result.procedure
-            df.at[idx, "equipment"] = result.equipment
-            df.at[idx, "capability"] = result.capability
+                for col in _CONTENT_COLUMNS:
+                    cleaned[col][pos] = getattr(result, col)
+
+            if needs_types[pos]:
+                if needs_facility[pos] and result.facilityTypeId:
+                    facility_types[pos] = result.facilityTypeId
+                if needs_operator[pos] and result.operatorTypeId:
+                    operator_types[pos] = result.operatorTypeId
+                types_inferred += 1
 
             if usage:
                 total_prompt_tokens += usage.prompt_tokens
@@ -333,16 +518,20 @@ def classify_and_reclassify(df: pd.DataFrame) -> pd.DataFrame:
             processed += 1
             if processed % 50 == 0:
                 logger.info("Step 4 progress: %d/%d facilities processed", processed, len(df))
+    cache.close()
 
-        except Exception as e:
-            logger.error("Step 4 failed for facility '%s': %s", row.get("name", "?"), e)
-            # Keep original data on failure
-            continue
+    if processed:
+        for col in _CONTENT_COLUMNS:
+            df[col] = pd.Series(cleaned[col], index=df.index, dtype=object)
+    if infer_types:
+        df["facilityTypeId"] = facility_types
+        df["operatorTypeId"] = operator_types
 
     logger.info(
-        "Step 4 complete: processed %d, skipped %d (no content). "
-        "Tokens: %d prompt + %d completion = %d total",
+        "Step 4 complete: processed %d (%d with type inference), skipped %d "
+        "(no content). Tokens: %d prompt + %d completion = %d total",
         processed,
+        types_inferred,
         skipped,
         total_prompt_tokens,
         total_completion_tokens,
@@ -362,6 +551,16 @@ _FACILITY_TYPE_PATTERNS: list[tuple[re.Pattern, str]] = [
     (re.compile(r"\bDr\.?\s", re.I), "doctor"),
 ]
 
+# All facility-type patterns fused into one alternation, one named group
+# per type, so a name is scanned once instead of once per pattern
+_FACILITY_TYPE_RE = re.compile(
+    "|".join(
+        f"(?P<{ftype}>{pattern.pattern})" for pattern, ftype in _FACILITY_TYPE_PATTERNS
+    ),
+    re.I,
+)
+_FACILITY_TYPES = [ftype for _, ftype in _FACILITY_TYPE_PATTERNS]
+
 # Heuristic patterns for operatorTypeId
 _OPERATOR_PUBLIC_PATTERNS = re.compile(
     r"\b(government|public|district|regional|municipal|teaching|polyclinic|"
@@ -376,12 +575,18 @@ _OPERATOR_PRIVATE_PATTERNS = re.compile(
 
 def _heuristic_facility_type(name: str | None) -> str | None:
     """Try to infer facilityTypeId from the facility name."""
-    if not name:
+    if not isinstance(name, str) or not name:
+        return None
+    m = _FACILITY_TYPE_RE.search(name)
+    if m is None:
         return None
-    for pattern, ftype in _FACILITY_TYPE_PATTERNS:
-        if pattern.search(name):
+    # The alternation returns the leftmost match, but list order decides
+    # between types: a higher-priority pattern may still occur further right
+    rank = _FACILITY_TYPES.index(m.lastgroup)
+    for pattern, ftype in _FACILITY_TYPE_PATTERNS[:rank]:
+        if pattern.search(name, m.start() + 1):
             return ftype
-    return None
+    return m.lastgroup
 
 
 def _heuristic_operator_type(
@@ -390,7 +595,7 @@ def _heuristic_operator_type(
     org_description: str | None,
 ) -> str | None:
     """Try to infer operatorTypeId from name and descriptions."""
-    texts = [t for t in (name, description, org_description) if t]
+    texts = [t for t in (name, description, org_description) if isinstance(t, str) and t]
     combined = " ".join(texts)
     if not combined:
         return None
@@ -401,35 +606,95 @@ def _heuristic_operator_type(
     return None
 
 
-def infer_missing_fields(df: pd.DataFrame) -> pd.DataFrame:
+def _contains(texts: pd.Series, pattern: re.Pattern) -> np.ndarray:
+    """Boolean mask of the texts ``pattern`` matches anywhere in.
+
+    ``texts`` should be object dtype, so matching uses Python's ``re`` with
+    the same (Unicode) semantics as the scalar heuristics.
+    """
+    with warnings.catch_warnings():
+        # Capture groups are irrelevant for a yes/no match
+        warnings.filterwarnings("ignore", "This pattern is interpreted", UserWarning)
+        return texts.str.contains(pattern, na=False).to_numpy(dtype=bool)
+
+
+def _heuristic_facility_types(names: list) -> np.ndarray:
+    """``_heuristic_facility_type`` over a column of names.
+
+    With the patterns fused into ``_FACILITY_TYPE_RE`` most names take a
+    single regex scan, which is cheaper than running ``str.contains`` once
+    per pattern over the column.
+    """
+    return np.array([_heuristic_facility_type(name) for name in names], dtype=object)
+
+
+def _heuristic_operator_types(
+    names: list, descriptions: list, org_descriptions: list
+) -> np.ndarray:
+    """Vectorized ``_heuristic_operator_type`` over columns of texts."""
+    combined = pd.Series(
+        [
+            " ".join(t for t in texts if isinstance(t, str) and t)
+            for texts in zip(names, descriptions, org_descriptions)
+        ],
+        dtype=object,
+    )
+    public = _contains(combined, _OPERATOR_PUBLIC_PATTERNS)
+    private = _contains(combined, _OPERATOR_PRIVATE_PATTERNS)
+    return np.where(public, "public", np.where(private, "private", None)).astype(
+        object
+    )
+
+
+def _build_inference_user_prompt(
+    name="Unknown", description=None, org_description=None, **context
+) -> str:
+    """Build the Step 5 user prompt; ``context`` maps list columns to entries."""
+    parts = _facility_context(name, description, org_description)
+    # Include capabilities as context
+    for col, items in context.items():
+        if items:
+            parts.append(f"{col}: {items}")
+    return "\n".join(parts)
+
+
+def infer_missing_fields(
+    df: pd.DataFrame,
+    max_workers: int = MAX_CONCURRENT_LLM_CALLS,
+    use_cache: bool = True,
+    use_llm: bool = True,
+) -> pd.DataFrame:
     """Step 5: Infer missing facilityTypeId and operatorTypeId.
 
-    Uses heuristics first, then falls back to LLM for ambiguous cases.
+    Uses heuristics first, then falls back to LLM for ambiguous cases,
+    sending at most ``max_workers`` facilities concurrently.  LLM responses
+    are cached like in Step 4.  Inferred values are collected per column
+    and written back as whole columns, rather than cell by cell.
+
+    With ``use_llm=False`` only the heuristics run (``run_llm_steps`` leaves
+    the LLM fallback to the combined Step 4 call).
     """
     df = df.copy()
 
-    # Phase 1: Heuristic inference
-    heuristic_facility = 0
-    heuristic_operator = 0
+    facility_types = np.array(_column_values(df, "facilityTypeId"), dtype=object)
+    operator_types = np.array(_column_values(df, "operatorTypeId"), dtype=object)
+    names = _column_values(df, "name")
+    descriptions = _column_values(df, "description")
+    org_descriptions = _column_values(df, "organizationDescription")
 
-    for idx in df.index:
-        row = df.loc[idx]
+    # Phase 1: Heuristic inference, one vectorized pass per field
+    inferred = _heuristic_facility_types(names)
+    fill = pd.isna(facility_types) & pd.notna(inferred)
+    facility_types[fill] = inferred[fill]
+    heuristic_facility = int(fill.sum())
 
-        if row.get("facilityTypeId") is None:
-            inferred = _heuristic_facility_type(row.get("name"))
-            if inferred:
-                df.at[idx, "facilityTypeId"] = inferred
-                heuristic_facility += 1
+    inferred = _heuristic_operator_types(names, descriptions, org_descriptions)
+    fill = pd.isna(operator_types) & pd.notna(inferred)
+    operator_types[fill] = inferred[fill]
+    heuristic_operator = int(fill.sum())
 
-        if row.get("operatorTypeId") is None:
-            inferred = _heuristic_operator_type(
-                row.get("name"),
-                row.get("description"),
-                row.get("organizationDescription"),
-            )
-            if inferred:
-                df.at[idx, "operatorTypeId"] = inferred
-                heuristic_operator += 1
+    df["facilityTypeId"] = facility_types
+    df["operatorTypeId"] = operator_types
 
     logger.info(
         "Step 5 heuristics: inferred %d facilityTypeId, %d operatorTypeId",
@@ -438,56 +703,63 @@ def infer_missing_fields(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     # Phase 2: LLM fallback for remaining nulls
-    needs_facility = df["facilityTypeId"].isna() if "facilityTypeId" in df.columns else pd.Series(dtype=bool)
-    needs_operator = df["operatorTypeId"].isna() if "operatorTypeId" in df.columns else pd.Series(dtype=bool)
-    needs_llm = needs_facility | needs_operator
-    llm_indices = df.index[needs_llm].tolist()
+    needs_facility = pd.isna(facility_types)
+    needs_operator = pd.isna(operator_types)
+    llm_positions = np.flatnonzero(needs_facility | needs_operator).tolist()
 
-    if not llm_indices:
+    if not llm_positions:
         logger.info("Step 5 complete: no LLM calls needed (all fields inferred by heuristics)")
         return df
 
+    if not use_llm:
+        logger.info("Step 5: %d facilities left for the LLM fallback", len(llm_positions))
+        return df
+
     try:
         client = get_openai_client()
     except (ImportError, EnvironmentError) as e:
-        logger.warning("Step 5: LLM unavailable (%s). %d fields remain null.", e, len(llm_indices))
+        logger.warning("Step 5: LLM unavailable (%s). %d fields remain null.", e, len(llm_positions))
         return df
 
     total_prompt_tokens = 0
     total_completion_tokens = 0
     llm_inferred = 0
 
-    for idx in llm_indices:
-        row = df.loc[idx]
-
-        parts = [f"Facility: {row.get('name', 'Unknown')}"]
-        desc = row.get("description")
-        if desc:
-            parts.append(f"Description: {desc}")
-        org_desc = row.get("organizationDescription")
-        if org_desc:
-            parts.append(f"Organization Description: {org_desc}")
-
-        # Include capabilities as context
-        for col in ("specialties", "capability"):
-            items = row.get(col, [])
-            if items:
-                parts.append(f"{col}: {items}")
+    display_names = _column_values(df, "name", "Unknown")
+    specialties = _column_values(df, "specialties", [])
+    capabilities = _column_values(df, "capability", [])
 
-        user_prompt = "\n".join(parts)
-
-        try:
-            result, usage = call_llm_structured(
+    cache = _open_cache(use_cache)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                call_llm_structured,
                 client,
                 FIELD_INFERENCE_SYSTEM_PROMPT,
-                user_prompt,
+                _build_inference_user_prompt(
+                    display_names[pos],
+                    descriptions[pos],
+                    org_descriptions[pos],
+                    specialties=specialties[pos],
+                    capability=capabilities[pos],
+                ),
                 FacilityTypeInference,
-            )
+                cache=cache,
+            ): pos
+            for pos in llm_positions
+        }
+        for future in as_completed(futures):
+            pos = futures[future]
+            try:
+                result, usage = future.result()
+            except Exception as e:
+                logger.error("Step 5 LLM failed for '%s': %s", display_names[pos], e)
+                continue
 
-            if row.get("facilityTypeId") is None and result.facilityTypeId:
-                df.at[idx, "facilityTypeId"] = result.facilityTypeId
-            if row.get("operatorTypeId") is None and result.operatorTypeId:
-                df.at[idx, "operatorTypeId"] = result.operatorTypeId
+            if needs_facility[pos] and result.facilityTypeId:
+                facility_types[pos] = result.facilityTypeId
+            if needs_operator[pos] and result.operatorTypeId:
+                operator_types[pos] = result.operatorTypeId
 
             if usage:
                 total_prompt_tokens += usage.prompt_tokens
@@ -495,11 +767,11 @@ def infer_missing_fields(df: pd.DataFrame) -> pd.DataFrame:
 
             llm_inferred += 1
             if llm_inferred % 50 == 0:
-                logger.info("Step 5 LLM progress: %d/%d", llm_inferred, len(llm_indices))
+                logger.info("Step 5 LLM progress: %d/%d", llm_inferred, len(llm_positions))
+    cache.close()
 
-        except Exception as e:
-            logger.error("Step 5 LLM failed for '%s': %s", row.get("name", "?"), e)
-            continue
+    df["facilityTypeId"] = facility_types
+    df["operatorTypeId"] = operator_types
 
     logger.info(
         "Step 5 complete: LLM processed %d facilities. "
@@ -526,9 +798,15 @@ def infer_missing_fields(df: pd.DataFrame) -> pd.DataFrame:
 # ── Public orchestrator ──────────────────────────────────────────────
 
 
-def run_llm_steps(df: pd.DataFrame) -> pd.DataFrame:
-    """Run Steps 4 and 5 in sequence. Requires OPENAI_API_KEY."""
-    df = classify_and_reclassify(df)  # Step 4
-    df = infer_missing_fields(df)  # Step 5
-    return df
+def run_llm_steps(
+    df: pd.DataFrame, max_workers: int = MAX_CONCURRENT_LLM_CALLS
+) -> pd.DataFrame:
+    """Run Steps 4 and 5. Requires OPENAI_API_KEY.
 
+    The Step 5 heuristics run first; whatever they leave missing is
+    inferred by the Step 4 call itself, so each facility costs at most one
+    LLM request.  Each step keeps up to ``max_workers`` calls in flight.
+    """
+    df = infer_missing_fields(df, use_llm=False)  # Step 5 heuristics
+    df = classify_and_reclassify(df, max_workers=max_workers, infer_types=True)  # Step 4 + 5
+    return df
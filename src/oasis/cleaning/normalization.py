@@ -11,12 +11,25 @@ Uses sentence-transformers (all-MiniLM-L6-v2) to:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import importlib.util
 import logging
-from collections import Counter
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 
+try:
+    from scipy import sparse
+    from scipy.sparse import csgraph
+except ImportError:  # pragma: no cover - optional speedup
+    sparse = csgraph = None
+
+from oasis.cleaning._cache import SQLiteCache
+from oasis.config import _PROJECT_DATA_DIR
+
 logger = logging.getLogger(__name__)
 
 # Re-use the valid specialties list from llm_extraction
@@ -26,9 +39,28 @@ from oasis.cleaning.llm_extraction import VALID_SPECIALTIES
 
 _MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Terms per encode batch; encode() already sorts by length, so larger
+# batches add little padding
+_ENCODE_BATCH_SIZE = 128
+
+# Serializes model loading and encoding across the per-column threads of
+# run_normalization: torch already spreads one encode() over all cores, and
+# the Rust tokenizer is not safe to share between concurrent calls
+_MODEL_LOCK = threading.Lock()
+
 
-def _load_model():
-    """Load the sentence-transformer model."""
+@functools.lru_cache(maxsize=2)
+def _get_model(backend: str = "torch"):
+    """Load the sentence-transformer model.
+
+    Cached for the process lifetime, so repeated ``run_normalization`` calls
+    reuse one model instead of reloading the weights each time.  The model
+    is placed on CUDA, then MPS, then CPU, whichever is available first.
+
+    ``backend="onnx"`` runs the model through ONNX Runtime (exported on
+    first use), which is faster on CPU.  It needs sentence-transformers
+    >= 3.2 with the ``onnx`` extra; without them the torch model is used.
+    """
     try:
         from sentence_transformers import SentenceTransformer
     except ImportError:
@@ -36,18 +68,181 @@ def _load_model():
             "sentence-transformers is required for synonym normalization. "
             "Install with: pip install sentence-transformers"
         )
-    return SentenceTransformer(_MODEL_NAME)
+    if backend == "onnx":
+        missing = [
+            name
+            for name in ("optimum", "onnxruntime")
+            if importlib.util.find_spec(name) is None
+        ]
+        if missing:
+            logger.warning(
+                "ONNX backend unavailable (%s not installed), using torch",
+                ", ".join(missing),
+            )
+            return _get_model()
+        try:
+            return SentenceTransformer(_MODEL_NAME, backend="onnx")
+        except Exception as e:
+            # Older sentence-transformers reject the backend argument
+            # (TypeError); newer ones raise a bare Exception on a failed export
+            logger.warning("ONNX backend unavailable, using torch: %s", e)
+            return _get_model()
+    model = SentenceTransformer(_MODEL_NAME)
+    # Half precision only pays off on a GPU; on CPU it is slower than fp32
+    if model.device.type == "cuda":
+        model.half()
+    return model
+
+
+def _encode(texts: list[str], backend: str = "torch") -> np.ndarray:
+    """Encode texts with the model, returning normalized float32 vectors."""
+    with _MODEL_LOCK:
+        embeddings = _get_model(backend).encode(
+            texts,
+            batch_size=_ENCODE_BATCH_SIZE,
+            show_progress_bar=False,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+    # An fp16 model returns fp16 vectors; NumPy has no fast fp16 matmul
+    return np.asarray(embeddings, dtype=np.float32)
+
 
+def _embed(
+    texts: list[str],
+    cache: _EmbeddingCache | None = None,
+    backend: str = "torch",
+) -> np.ndarray:
+    """Embed a list of texts, returning normalized float32 vectors.
 
-def _embed(model, texts: list[str]) -> np.ndarray:
-    """Embed a list of texts, returning normalized vectors."""
+    With a ``cache``, only texts not seen before are encoded (and the model
+    is not loaded at all when every text hits).
+    """
     if not texts:
         return np.array([])
-    return model.encode(texts, show_progress_bar=False, normalize_embeddings=True)
+    if cache is None:
+        return _encode(texts, backend)
+
+    vectors = cache.get_many(texts)
+    misses = [i for i, vec in enumerate(vectors) if vec is None]
+    if misses:
+        missing = [texts[i] for i in misses]
+        encoded = _encode(missing, backend)
+        cache.set_many(missing, encoded)
+        for i, vec in zip(misses, encoded):
+            vectors[i] = vec
+    return np.stack(vectors)
+
+
+# ── Embedding cache ───────────────────────────────────────────────────
+
+
+class _EmbeddingCache(SQLiteCache[np.ndarray]):
+    """Two-tier cache of term embeddings keyed by model name and text.
+
+    A vocabulary seen before is never re-encoded.  Vectors are stored as
+    raw float32 bytes.
+    """
+
+    table = "embedding"
+    columns = ("vector BLOB",)
+    label = "Embedding"
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.blake2b(
+            f"{_MODEL_NAME}|{text}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _decode(self, row: tuple) -> np.ndarray:
+        return np.frombuffer(row[0], dtype=np.float32)
+
+    def get_many(self, texts: list[str]) -> list[np.ndarray | None]:
+        """Return the cached vector for each text, None where it is a miss."""
+        return self._get_many([self._key(t) for t in texts])
+
+    def set_many(self, texts: list[str], embeddings: np.ndarray) -> None:
+        """Store one vector per text in memory and on disk."""
+        self._put_many(
+            (
+                self._key(text),
+                vec,
+                (np.asarray(vec, dtype=np.float32).tobytes(),),
+            )
+            for text, vec in zip(texts, embeddings)
+        )
+
+
+def _open_cache(use_cache: bool) -> _EmbeddingCache:
+    """Open the on-disk embedding cache, or a memory-only one if disabled."""
+    path = _PROJECT_DATA_DIR / ".embedding_cache.sqlite"
+    return _EmbeddingCache(path if use_cache else None)
 
 
 # ── Synonym clustering ────────────────────────────────────────────────
 
+# Rows of the similarity matrix computed per block; bounds peak memory at
+# _SIMILARITY_BLOCK_ROWS * n floats instead of the full n * n matrix
+_SIMILARITY_BLOCK_ROWS = 1024
+
+
+def _similar_pairs(
+    embeddings: np.ndarray, threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return index pairs ``(i, j)``, ``i < j``, with cosine similarity >= threshold.
+
+    Streams the upper triangle of ``embeddings @ embeddings.T`` one block
+    of rows at a time, so the full matrix is never materialized and the
+    threshold test runs vectorized instead of cell by cell.
+    """
+    n = len(embeddings)
+    rows: list[np.ndarray] = []
+    cols: list[np.ndarray] = []
+    for start in range(0, n, _SIMILARITY_BLOCK_ROWS):
+        stop = min(start + _SIMILARITY_BLOCK_ROWS, n)
+        # Only columns >= start can lie above the diagonal for this block
+        block = embeddings[start:stop] @ embeddings[start:].T
+        i, j = np.nonzero(block >= threshold)
+        i += start
+        j += start
+        upper = j > i
+        rows.append(i[upper])
+        cols.append(j[upper])
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _connected_components(
+    n: int, rows: np.ndarray, cols: np.ndarray
+) -> np.ndarray:
+    """Label the connected components of an undirected graph on ``n`` nodes.
+
+    Edges are given as parallel index arrays.  Uses SciPy's C-level graph
+    traversal when it is installed (it comes with sentence-transformers);
+    otherwise hooks each edge's larger label onto the smaller one and
+    pointer-jumps in NumPy until every edge joins two equal labels.
+    Label values are arbitrary, only equality between nodes is meaningful.
+    """
+    if csgraph is not None:
+        graph = sparse.coo_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n)
+        )
+        return csgraph.connected_components(graph, directed=False)[1]
+
+    labels = np.arange(n)
+    while True:
+        lr, lc = labels[rows], labels[cols]
+        if np.array_equal(lr, lc):
+            return labels
+        # Hook: each root points to the smallest label it is joined to
+        np.minimum.at(labels, lr, lc)
+        np.minimum.at(labels, lc, lr)
+        # Pointer jumping: flatten every tree down to its root
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
 
 def _cluster_synonyms(
     terms: list[str],
@@ -64,38 +259,20 @@ def _cluster_synonyms(
     if n == 0:
         return {}
 
-    # Compute pairwise cosine similarity (embeddings are already normalized)
-    sim_matrix = embeddings @ embeddings.T
-
-    # Union-Find for clustering
-    parent = list(range(n))
-
-    def find(x):
-        while parent[x] != x:
-            parent[x] = parent[parent[x]]
-            x = parent[x]
-        return x
-
-    def union(a, b):
-        ra, rb = find(a), find(b)
-        if ra != rb:
-            parent[ra] = rb
+    # Pairs above the threshold (embeddings are already normalized, so the
+    # dot product is the cosine similarity)
+    pair_rows, pair_cols = _similar_pairs(embeddings, threshold)
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            if sim_matrix[i, j] >= threshold:
-                union(i, j)
-
-    # Group terms by cluster
-    clusters: dict[int, list[int]] = {}
-    for i in range(n):
-        root = find(i)
-        clusters.setdefault(root, []).append(i)
+    # Cluster = connected component of the similarity graph
+    labels = _connected_components(n, pair_rows, pair_cols)
+    order = np.argsort(labels, kind="stable")
+    _, starts = np.unique(labels[order], return_index=True)
+    clusters = np.split(order, starts[1:])
 
     # Pick canonical representative per cluster
     term_to_canonical: dict[str, str] = {}
-    for indices in clusters.values():
-        cluster_terms = [terms[i] for i in indices]
+    for indices in clusters:
+        cluster_terms = [terms[i] for i in indices.tolist()]
         # Pick: shortest term, breaking ties by alphabetical
         canonical = min(cluster_terms, key=lambda t: (len(t), t))
         for t in cluster_terms:
@@ -105,97 +282,140 @@ def _cluster_synonyms(
 
 
 def _normalize_column_synonyms(
-    df: pd.DataFrame,
-    col: str,
-    model,
+    column: pd.Series,
+    cache: _EmbeddingCache | None = None,
     threshold: float = 0.85,
-) -> tuple[pd.DataFrame, int]:
+    backend: str = "torch",
+) -> tuple[pd.Series, int]:
     """Normalize synonyms in a single list column.
 
-    Returns the updated DataFrame and the number of replacements made.
+    Returns the normalized column (``column`` itself when nothing changes)
+    and the number of replacements made.
     """
-    # Collect all unique terms with their frequencies
-    term_counter: Counter = Counter()
-    for items in df[col]:
-        if isinstance(items, list):
-            for item in items:
-                term_counter[item] += 1
+    values = column.to_numpy(dtype=object)
 
-    unique_terms = list(term_counter.keys())
+    # Collect all unique terms, in first-seen order, from the list cells
+    is_list = np.fromiter(
+        (isinstance(items, list) for items in values), dtype=bool, count=len(values)
+    )
+    entries = pd.Series(values[is_list], dtype=object).explode().dropna()
+    unique_terms = pd.unique(entries).tolist()
     if len(unique_terms) < 2:
-        return df, 0
+        return column, 0
 
     # Embed and cluster
-    embeddings = _embed(model, unique_terms)
+    embeddings = _embed(unique_terms, cache, backend)
     term_map = _cluster_synonyms(unique_terms, embeddings, threshold)
 
     # Count how many terms are being remapped to a different canonical
     replacements = sum(1 for t, c in term_map.items() if t != c)
     if replacements == 0:
-        return df, 0
+        return column, 0
+
+    # Canonical form and its lowercase dedup key, computed once per term
+    # instead of once per occurrence
+    canonical_of = {term: (canon, canon.lower()) for term, canon in term_map.items()}
 
     # Apply normalization
     def _normalize(items: list[str]) -> list[str]:
         seen: set[str] = set()
         result: list[str] = []
         for item in items:
-            canonical = term_map.get(item, item)
-            if canonical.lower() not in seen:
-                seen.add(canonical.lower())
+            canonical, key = canonical_of.get(item) or (item, item.lower())
+            if key not in seen:
+                seen.add(key)
                 result.append(canonical)
         return result
 
-    df = df.copy()
-    df[col] = df[col].apply(lambda items: _normalize(items) if isinstance(items, list) else items)
-
-    return df, replacements
+    # Identical cells (chains, empty lists) are normalized once; repeats get
+    # a copy so no two rows share a list object
+    done: dict[tuple[str, ...], list[str]] = {}
+    normalized: list = []
+    for items in values:
+        if not isinstance(items, list):
+            normalized.append(items)
+            continue
+        key = tuple(items)
+        result = done.get(key)
+        if result is None:
+            result = done[key] = _normalize(items)
+            normalized.append(result)
+        else:
+            normalized.append(list(result))
+    return pd.Series(normalized, index=column.index, dtype=object), replacements
 
 
 # ── Specialty validation ──────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4)
+def _get_valid_embeddings(backend: str = "torch", use_cache: bool = True) -> np.ndarray:
+    """Embed VALID_SPECIALTIES, once per process and backend.
+
+    The enum is fixed, so its vectors are kept like the model itself.  They
+    are looked up in the embedding cache first (unless ``use_cache`` is
+    False), so a warm run does not load the model for them.
+    """
+    cache = _open_cache(use_cache)
+    try:
+        return _embed(VALID_SPECIALTIES, cache, backend)
+    finally:
+        cache.close()
+
 
-def _validate_specialties(df: pd.DataFrame, model) -> tuple[pd.DataFrame, int]:
+def _validate_specialties(
+    specialties: pd.Series,
+    cache: _EmbeddingCache | None = None,
+    backend: str = "torch",
+    use_cache: bool = True,
+) -> tuple[pd.Series, int]:
     """Validate and correct specialty names via embedding similarity.
 
     Maps each specialty entry to the nearest valid specialty from the enum.
     Only remaps if the similarity is above a threshold; otherwise drops.
+    Returns the corrected column (``specialties`` itself when every term is
+    already valid) and the number of remapped terms.
     """
-    if "specialties" not in df.columns:
-        return df, 0
-
     # Collect unique specialty terms currently in the data
     current_terms: set[str] = set()
-    for items in df["specialties"]:
+    for items in specialties:
         if isinstance(items, list):
             current_terms.update(items)
 
     if not current_terms:
-        return df, 0
+        return specialties, 0
 
     # Filter out terms that are already valid
     invalid_terms = [t for t in current_terms if t not in VALID_SPECIALTIES]
     if not invalid_terms:
         logger.info("All specialty terms are already valid")
-        return df, 0
+        return specialties, 0
 
     # Embed invalid terms and valid specialties
-    invalid_embeddings = _embed(model, invalid_terms)
-    valid_embeddings = _embed(model, VALID_SPECIALTIES)
+    invalid_embeddings = _embed(invalid_terms, cache, backend)
+    valid_embeddings = _get_valid_embeddings(backend, use_cache)
 
-    # Find best match for each invalid term
+    # Find best match for each invalid term; drop it if too dissimilar
     similarity = invalid_embeddings @ valid_embeddings.T  # (n_invalid, n_valid)
-    remap: dict[str, str | None] = {}
-    for i, term in enumerate(invalid_terms):
-        best_idx = int(np.argmax(similarity[i]))
-        best_score = float(similarity[i, best_idx])
-        if best_score >= 0.7:
-            remap[term] = VALID_SPECIALTIES[best_idx]
-            logger.debug("Specialty remap: '%s' -> '%s' (%.3f)", term, VALID_SPECIALTIES[best_idx], best_score)
-        else:
-            remap[term] = None  # Drop: too dissimilar
-            logger.debug("Specialty dropped: '%s' (best match: '%.3f')", term, best_score)
+    best_idx = similarity.argmax(axis=1)
+    best_score = similarity[np.arange(len(invalid_terms)), best_idx].astype(np.float64)
+    matched = best_score >= 0.7
+    best_match = np.array(VALID_SPECIALTIES, dtype=object)[best_idx]
+    remap: dict[str, str | None] = dict(
+        zip(invalid_terms, np.where(matched, best_match, None).tolist())
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for term, mapped, score in zip(invalid_terms, remap.values(), best_score):
+            if mapped is not None:
+                logger.debug(
+                    "Specialty remap: '%s' -> '%s' (%.3f)", term, mapped, score
+                )
+            else:
+                logger.debug(
+                    "Specialty dropped: '%s' (best match: '%.3f')", term, score
+                )
 
-    corrections = sum(1 for v in remap.values() if v is not None)
+    corrections = int(matched.sum())
 
     # Apply remapping
     def _fix_specialties(items: list[str]) -> list[str]:
@@ -211,8 +431,7 @@ def _validate_specialties(df: pd.DataFrame, model) -> tuple[pd.DataFrame, int]:
                 result.append(mapped)
         return result
 
-    df = df.copy()
-    df["specialties"] = df["specialties"].apply(
+    fixed = specialties.apply(
         lambda items: _fix_specialties(items) if isinstance(items, list) else items
     )
 
@@ -222,36 +441,85 @@ def _validate_specialties(df: pd.DataFrame, model) -> tuple[pd.DataFrame, int]:
         corrections,
         len(invalid_terms) - corrections,
     )
-    return df, corrections
+    return fixed, corrections
 
 
 # ── Public orchestrator ──────────────────────────────────────────────
 
 FREEFORM_COLUMNS = ("procedure", "equipment", "capability")
 
+# One task per free-form column plus the specialty validation
+_NORMALIZATION_WORKERS = len(FREEFORM_COLUMNS) + 1
 
-def run_normalization(df: pd.DataFrame, similarity_threshold: float = 0.85) -> pd.DataFrame:
+
+def run_normalization(
+    df: pd.DataFrame,
+    similarity_threshold: float = 0.85,
+    use_cache: bool = True,
+    use_onnx: bool = False,
+) -> pd.DataFrame:
     """Step 6: Normalize synonyms and validate specialties.
 
     1. Cluster synonymous terms in procedure/equipment/capability.
     2. Replace cluster members with canonical representatives.
     3. Validate specialties against the exact enum.
-    """
-    model = _load_model()
 
-    total_replacements = 0
-
-    # Synonym normalization for free-form columns
-    for col in FREEFORM_COLUMNS:
-        if col in df.columns:
-            df, replacements = _normalize_column_synonyms(df, col, model, similarity_threshold)
-            if replacements:
-                logger.info("Step 6: %s -- %d synonym replacements", col, replacements)
-            total_replacements += replacements
+    Term embeddings are cached in ``oasis_data/.embedding_cache.sqlite``
+    (unless ``use_cache`` is False), so repeated runs only encode new terms.
+    With ``use_onnx``, terms are encoded through ONNX Runtime instead of
+    torch (see ``_get_model``).
+    """
+    backend = "onnx" if use_onnx else "torch"
+    cache = _open_cache(use_cache)
+    synonym_cols = [col for col in FREEFORM_COLUMNS if col in df.columns]
+    specialties = df["specialties"] if "specialties" in df.columns else None
 
-    # Specialty validation
-    df, specialty_corrections = _validate_specialties(df, model)
-    total_replacements += specialty_corrections
+    # The columns are independent; each task returns a new Series for its
+    # own column, and all of them are applied with one assign() at the end
+    try:
+        with ThreadPoolExecutor(max_workers=_NORMALIZATION_WORKERS) as executor:
+            synonym_futures = {
+                col: executor.submit(
+                    _normalize_column_synonyms,
+                    df[col],
+                    cache,
+                    similarity_threshold,
+                    backend,
+                )
+                for col in synonym_cols
+            }
+            specialty_future = (
+                executor.submit(
+                    _validate_specialties, specialties, cache, backend, use_cache
+                )
+                if specialties is not None
+                else None
+            )
+
+            updates: dict[str, pd.Series] = {}
+            total_replacements = 0
+
+            # Synonym normalization for free-form columns
+            for col, future in synonym_futures.items():
+                normalized, replacements = future.result()
+                if replacements:
+                    logger.info(
+                        "Step 6: %s -- %d synonym replacements", col, replacements
+                    )
+                    updates[col] = normalized
+                total_replacements += replacements
+
+            # Specialty validation
+            if specialty_future is not None:
+                validated, specialty_corrections = specialty_future.result()
+                if validated is not specialties:
+                    updates["specialties"] = validated
+                total_replacements += specialty_corrections
+    finally:
+        cache.close()
+
+    if updates:
+        df = df.assign(**updates)
 
     logger.info("Step 6 complete: %d total normalizations applied", total_replacements)
     return df
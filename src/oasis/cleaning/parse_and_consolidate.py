@@ -14,7 +14,14 @@ import logging
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import infer_dtype
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +88,23 @@ FACILITY_TYPE_TYPOS = {
 
 # ── Step 2 helpers ────────────────────────────────────────────────────
 
+def _loads(s: str) -> Any:
+    """Decode JSON, using orjson for the common case of a list of strings.
+
+    Anything else is decoded again with ``json``: orjson rejects some text
+    the standard library accepts (NaN literals, lone surrogates) and turns
+    integers beyond 64 bits into floats, which would change their ``str``.
+    """
+    if orjson is not None:
+        try:
+            parsed = orjson.loads(s)
+        except orjson.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, list) and all(isinstance(x, str) for x in parsed):
+            return parsed
+    return json.loads(s)
+
+
 def _parse_json_list(raw: Any) -> list[str]:
     """Parse a raw cell value into a list of strings.
 
@@ -93,9 +117,9 @@ def _parse_json_list(raw: Any) -> list[str]:
     if s in ("", "null", "[]", "None"):
         return []
     try:
-        parsed = json.loads(s)
+        parsed = _loads(s)
         if isinstance(parsed, list):
-            return [str(item).strip() for item in parsed if str(item).strip()]
+            return [text for item in parsed if (text := str(item).strip())]
         # Single scalar value in JSON
         return [str(parsed).strip()] if str(parsed).strip() else []
     except (json.JSONDecodeError, TypeError):
@@ -103,41 +127,87 @@ def _parse_json_list(raw: Any) -> list[str]:
         return [s] if s else []
 
 
+def _parse_json_list_column(values: pd.Series) -> pd.Series:
+    """Apply ``_parse_json_list`` to a column, decoding each distinct cell once.
+
+    Many facilities repeat the same list text (chains, scraped duplicates),
+    so the column is factorized first.  Every row still gets its own list
+    object, so editing one row's list in place does not affect another.
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = [_parse_json_list(raw) for raw in uniques]
+    seen = [False] * len(parsed)
+    out: list[list[str]] = []
+    for code in codes.tolist():
+        if code < 0:
+            out.append([])
+        elif seen[code]:
+            out.append(list(parsed[code]))
+        else:
+            seen[code] = True
+            out.append(parsed[code])
+    return pd.Series(out, index=values.index, dtype=object)
+
+
+# Cell texts (after stripping) that mean "no value"
+_EMPTY_MARKERS = ("", "null", "None")
+
+
+def _strip_or_none(values: pd.Series) -> np.ndarray:
+    """Return ``values`` as stripped strings, with None for missing / empty.
+
+    Vectorized form of ``None if pd.isna(v) or str(v).strip() in
+    _EMPTY_MARKERS else str(v).strip()``.  Stripping runs on an object
+    column so it uses Python's ``str.strip`` whitespace rules.
+    """
+    stripped = values.astype(str).astype(object).str.strip()
+    empty = values.isna() | stripped.isin(_EMPTY_MARKERS)
+    out = stripped.to_numpy(dtype=object, copy=True)
+    out[empty.to_numpy(dtype=bool)] = None
+    return out
+
+
+def _clean_str_column(values: pd.Series) -> pd.Series:
+    """Strip a scalar column to strings, with None for missing and empty cells.
+
+    Text columns repeat a lot (cities, regions, facility types), so they
+    are factorized and each distinct value is cleaned once.  Other dtypes
+    are cleaned directly: factorizing would merge values such as 1 and 1.0
+    whose string forms differ.
+    """
+    if infer_dtype(values, skipna=True) != "string":
+        return pd.Series(_strip_or_none(values), index=values.index, dtype=object)
+    codes, uniques = pd.factorize(values)
+    # Code -1 (missing) picks the trailing None
+    cleaned = np.append(_strip_or_none(pd.Series(uniques, dtype=object)), None)
+    return pd.Series(cleaned[codes], index=values.index, dtype=object)
+
+
 def parse_and_standardize(df: pd.DataFrame) -> pd.DataFrame:
     """Step 1.1: Parse JSON arrays, normalize empties, fix typos, strip whitespace."""
-    df = df.copy()
+    # Every touched column is rebuilt as a new Series and applied with one
+    # assign(), so the input frame is never modified
+    updates: dict[str, pd.Series] = {}
 
     # Parse list columns into actual Python lists
     for col in LIST_COLUMNS:
         if col in df.columns:
-            df[col] = df[col].apply(_parse_json_list)
+            updates[col] = _parse_json_list_column(df[col])
 
-    # Fix facilityTypeId typos
-    if "facilityTypeId" in df.columns:
-        df["facilityTypeId"] = (
-            df["facilityTypeId"]
-            .apply(lambda v: None if pd.isna(v) or str(v).strip() in ("", "null", "None") else str(v).strip())
-            .map(lambda v: FACILITY_TYPE_TYPOS.get(v, v) if v else v)
-        )
+    # Strip whitespace from string scalar columns (facilityTypeId and
+    # operatorTypeId included) and normalize empties to None
+    for col in (*SCALAR_COLUMNS_PREFER_FIRST, *DESCRIPTION_COLUMNS):
+        if col in df.columns:
+            updates[col] = _clean_str_column(df[col])
 
-    # Normalize operatorTypeId empties
-    if "operatorTypeId" in df.columns:
-        df["operatorTypeId"] = df["operatorTypeId"].apply(
-            lambda v: None if pd.isna(v) or str(v).strip() in ("", "null", "None") else str(v).strip()
+    # Fix facilityTypeId typos
+    if "facilityTypeId" in updates:
+        types = updates["facilityTypeId"]
+        updates["facilityTypeId"] = types.mask(
+            types.isin(list(FACILITY_TYPE_TYPOS)), types.map(FACILITY_TYPE_TYPOS)
         )
 
-    # Strip whitespace from string scalar columns
-    for col in SCALAR_COLUMNS_PREFER_FIRST:
-        if col in df.columns:
-            df[col] = df[col].apply(
-                lambda v: str(v).strip() if not pd.isna(v) and str(v).strip() not in ("", "null", "None") else None
-            )
-
-    for col in DESCRIPTION_COLUMNS:
-        if col in df.columns:
-            df[col] = df[col].apply(
-                lambda v: str(v).strip() if not pd.isna(v) and str(v).strip() not in ("", "null", "None") else None
-            )
+    df = df.assign(**updates)
 
     logger.info("Step 2 complete: parsed JSON arrays and standardized %d rows", len(df))
     return df
@@ -166,27 +236,33 @@ def _pick_best_name(names: list[str | None]) -> str | None:
     return valid[0]
 
 
-def _first_non_null(values: list[Any]) -> Any:
-    """Return the first non-null value from a list."""
-    for v in values:
-        if v is not None:
-            return v
-    return None
-
-
-def _most_frequent(values: list[Any]) -> Any:
-    """Return the most frequent non-null value from a list.
+def _most_frequent_by_group(
+    codes: np.ndarray, values: pd.Series, n_groups: int
+) -> np.ndarray:
+    """Return the most frequent non-null value of each group.
 
-    Ties are broken by first occurrence order.
-    Falls back to first non-null if all values are unique.
+    ``codes`` gives each row's group (-1 for rows in no group).  Ties are
+    broken by first occurrence order, as ``Counter.most_common`` does.
+    Counts and first positions come from one groupby over (group, value)
+    pairs instead of a Counter per group.
     """
-    non_null = [v for v in values if v is not None]
-    if not non_null:
-        return None
-    from collections import Counter
-    counts = Counter(non_null)
-    # most_common returns [(value, count), ...] in order of count
-    return counts.most_common(1)[0][0]
+    valid = values.notna().to_numpy(dtype=bool) & (codes >= 0)
+    pairs = pd.DataFrame(
+        {
+            "group": codes[valid],
+            "value": values.to_numpy(dtype=object)[valid],
+            "pos": np.flatnonzero(valid),
+        }
+    )
+    stats = pairs.groupby(["group", "value"], sort=False)["pos"].agg(["size", "min"])
+    best = (
+        stats.reset_index()
+        .sort_values(["group", "size", "min"], ascending=[True, False, True])
+        .drop_duplicates("group")
+    )
+    out = np.full(n_groups, None, dtype=object)
+    out[best["group"].to_numpy()] = best["value"].to_numpy(dtype=object)
+    return out
 
 
 def _union_lists(list_of_lists: list[list[str]]) -> list[str]:
@@ -218,92 +294,137 @@ def _concat_unique_descriptions(descs: list[str | None]) -> str | None:
     return " ".join(unique) if unique else None
 
 
+def _none_for_missing(values: pd.Series) -> np.ndarray:
+    """Return ``values`` as an object array with None for every missing cell."""
+    out = values.to_numpy(dtype=object, copy=True)
+    out[values.isna().to_numpy(dtype=bool)] = None
+    return out
+
+
 def consolidate_rows(df: pd.DataFrame) -> pd.DataFrame:
-    """Step 1.2: Group by pk_unique_id and merge into one row per facility."""
+    """Step 1.2: Group by pk_unique_id and merge into one row per facility.
+
+    First-non-null scalars come from ``GroupBy.first``.  The other merges
+    (best name, most frequent address part, list unions, descriptions)
+    need the facility's values in row order; those are taken by sorting
+    the column once by facility and splitting it, rather than slicing a
+    sub-frame per facility.
+    """
     if "pk_unique_id" not in df.columns:
         logger.warning("No 'pk_unique_id' column -- skipping consolidation")
         return df
 
     before = len(df)
-    groups = df.groupby("pk_unique_id", sort=False)
-
-    rows: list[dict[str, Any]] = []
-    for pk_id, group in groups:
-        row: dict[str, Any] = {"pk_unique_id": pk_id}
-
-        # Name: pick best
-        row["name"] = _pick_best_name(group["name"].tolist() if "name" in group.columns else [])
-
-        # Scalar fields: first non-null (or most-frequent for address columns)
-        for col in SCALAR_COLUMNS_PREFER_FIRST:
-            if col in ("name",):
-                continue  # already handled
-            if col in group.columns:
-                if col in ADDRESS_COLUMNS_MOST_FREQUENT:
-                    row[col] = _most_frequent(group[col].tolist())
-                else:
-                    row[col] = _first_non_null(group[col].tolist())
-
-        # List fields: union
-        for col in LIST_COLUMNS:
-            if col in group.columns:
-                row[col] = _union_lists(group[col].tolist())
-            else:
-                row[col] = []
-
-        # Description: concatenate unique
-        for col in DESCRIPTION_COLUMNS:
-            if col in group.columns:
-                row[col] = _concat_unique_descriptions(group[col].tolist())
-
-        rows.append(row)
-
-    result = pd.DataFrame(rows)
+
+    # Facilities in first-seen order; rows with a missing id are dropped,
+    # as groupby does
+    codes, pk_ids = pd.factorize(df["pk_unique_id"])
+    order = np.argsort(codes, kind="stable")
+    order = order[codes[order] >= 0]
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+    n_facilities = len(pk_ids)
+
+    def per_facility(col: str) -> list[list[Any]]:
+        """Values of ``col`` as one list per facility, in row order."""
+        if n_facilities == 0:
+            return []
+        values = df[col].to_numpy(dtype=object)[order]
+        return [chunk.tolist() for chunk in np.split(values, bounds)]
+
+    first_cols = [
+        col
+        for col in SCALAR_COLUMNS_PREFER_FIRST
+        if col in df.columns
+        and col != "name"
+        and col not in ADDRESS_COLUMNS_MOST_FREQUENT
+    ]
+    first = df.groupby("pk_unique_id", sort=False)[first_cols].first()
+
+    result: dict[str, Any] = {}
+
+    # Name: pick best
+    result["name"] = (
+        [_pick_best_name(names) for names in per_facility("name")]
+        if "name" in df.columns
+        else [None] * n_facilities
+    )
+
+    # Scalar fields: first non-null (or most-frequent for address columns)
+    for col in SCALAR_COLUMNS_PREFER_FIRST:
+        if col == "name" or col not in df.columns:
+            continue
+        if col in ADDRESS_COLUMNS_MOST_FREQUENT:
+            result[col] = _most_frequent_by_group(codes, df[col], n_facilities)
+        else:
+            result[col] = _none_for_missing(first[col])
+
+    # List fields: union
+    for col in LIST_COLUMNS:
+        if col in df.columns:
+            result[col] = [_union_lists(lists) for lists in per_facility(col)]
+        else:
+            result[col] = [[] for _ in range(n_facilities)]
+
+    # Description: concatenate unique
+    for col in DESCRIPTION_COLUMNS:
+        if col in df.columns:
+            result[col] = [
+                _concat_unique_descriptions(descs) for descs in per_facility(col)
+            ]
+
+    # object dtype keeps None (not NaN) for missing scalars
+    result_df = pd.DataFrame(result, dtype=object)
+    result_df.insert(0, "pk_unique_id", pk_ids)
     logger.info(
         "Step 1 complete: consolidated %d rows -> %d facilities",
         before,
-        len(result),
+        len(result_df),
     )
-    return result
+    return result_df
 
 
 # ── Step 3: Light Universal Pre-Filter ────────────────────────────────
 
-# Bare phone number: optional +, then digits/spaces/dashes/parens only
-_BARE_PHONE = re.compile(
-    r"^\+?[\d\s\-().]{6,20}$"
-)
-
-# Bare URL: starts with http(s):// or www. and has no other text surrounding it
-_BARE_URL = re.compile(
-    r"^(https?://|www\.)\S+$", re.IGNORECASE
-)
-
-# Bare email
-_BARE_EMAIL = re.compile(
-    r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$"
-)
-
-# Bare numeric: just digits, commas, dots, optional percent/unit
-_BARE_NUMERIC = re.compile(
-    r"^[\d,.\s]+(%|km|m|kg|lb|ft)?$"
+# Entries with no natural language, as one alternation so each entry is
+# scanned once.  Only the URL scheme / www. prefix is case-insensitive.
+_STRUCTURAL_JUNK = re.compile(
+    # Bare phone number: optional +, then digits/spaces/dashes/parens only
+    r"\+?[\d\s\-().]{6,20}"
+    # Bare URL: starts with http(s):// or www. and has no other text around it
+    r"|(?i:https?://|www\.)\S+"
+    # Bare email
+    r"|[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+    # Bare numeric: just digits, commas, dots, optional percent/unit
+    r"|[\d,.\s]+(?:%|km|m|kg|lb|ft)?"
 )
 
 
 def _is_structural_junk(entry: str) -> bool:
     """Return True if the entry is structurally non-medical (no natural language)."""
     s = entry.strip()
-    if not s:
-        return True
-    if _BARE_PHONE.match(s):
-        return True
-    if _BARE_URL.match(s):
-        return True
-    if _BARE_EMAIL.match(s):
-        return True
-    if _BARE_NUMERIC.match(s):
-        return True
-    return False
+    return not s or _STRUCTURAL_JUNK.fullmatch(s) is not None
+
+
+def _filter_list_column(lists: list[list[str]]) -> list[list[str]]:
+    """Drop structural junk from every list, filtering each distinct list once.
+
+    Chains and empty cells repeat the same list across many facilities, so
+    results are memoized by the list's contents.  As in
+    ``_parse_json_list_column``, every row still gets its own list object.
+    """
+    filtered: dict[tuple[str, ...], list[str]] = {}
+    out: list[list[str]] = []
+    for items in lists:
+        key = tuple(items)
+        kept = filtered.get(key)
+        if kept is None:
+            kept = filtered[key] = [
+                item for item in items if not _is_structural_junk(item)
+            ]
+            out.append(kept)
+        else:
+            out.append(list(kept))
+    return out
 
 
 def light_prefilter(df: pd.DataFrame) -> pd.DataFrame:
@@ -313,7 +434,7 @@ def light_prefilter(df: pd.DataFrame) -> pd.DataFrame:
     bare URLs/emails, bare numeric values). Everything else passes through to
     the LLM for semantic classification.
     """
-    df = df.copy()
+    updates: dict[str, pd.Series] = {}
     total_removed = 0
     total_kept = 0
 
@@ -321,16 +442,16 @@ def light_prefilter(df: pd.DataFrame) -> pd.DataFrame:
         if col not in df.columns:
             continue
 
-        def _filter_list(items: list[str]) -> list[str]:
-            return [item for item in items if not _is_structural_junk(item)]
-
-        before_counts = df[col].apply(len).sum()
-        df[col] = df[col].apply(_filter_list)
-        after_counts = df[col].apply(len).sum()
+        lists = df[col].tolist()
+        filtered = _filter_list_column(lists)
+        before_counts = sum(map(len, lists))
+        after_counts = sum(map(len, filtered))
+        updates[col] = pd.Series(filtered, index=df.index, dtype=object)
         removed = before_counts - after_counts
         total_removed += removed
         total_kept += after_counts
 
+    df = df.assign(**updates)
     logger.info(
         "Step 3 complete: removed %d structural-junk entries, kept %d",
         total_removed,
@@ -7,8 +7,10 @@ Chains all cleaning steps:
   4. Free-form field cleaning
   5. Anomaly detection (rule-based and embedding-based)
 
-Each intermediate result is saved as vf_ghana_clean.csv so that individual
-steps can also be run standalone.
+Each intermediate result is snapshotted as vf_ghana_clean.parquet (list
+columns stay lists, and Parquet writes far faster than CSV) so that
+individual steps can also be run standalone; the final result is written
+as vf_ghana_clean.csv.
 
 Requires: GOOGLE_MAPS_API_KEY environment variable.
 
@@ -23,18 +25,11 @@ import time
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
 
-logger = logging.getLogger(__name__)
-
+from oasis.config import _PROJECT_ROOT
 
-def _find_project_root() -> Path:
-    """Find the project root (directory containing pyproject.toml or oasis_data)."""
-    current = Path(__file__).resolve().parent
-    for _ in range(10):
-        if (current / "pyproject.toml").exists() or (current / "oasis_data").exists():
-            return current
-        current = current.parent
-    return Path.cwd()
+logger = logging.getLogger(__name__)
 
 
 def _save_csv(df: pd.DataFrame, csv_path: Path) -> None:
@@ -56,6 +51,44 @@ def _save_csv(df: pd.DataFrame, csv_path: Path) -> None:
             raise
 
 
+def _snapshot_path(csv_path: Path) -> Path:
+    return csv_path.with_suffix(".parquet")
+
+
+def _save_snapshot(df: pd.DataFrame, csv_path: Path) -> Path:
+    """Save an intermediate result as Parquet next to the output CSV.
+
+    A frame Arrow cannot convert (e.g. a column mixing numbers and
+    strings, or text that is not valid UTF-8) is written as CSV instead.
+    Returns the path written.
+    """
+    path = _snapshot_path(csv_path)
+    try:
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    except (pa.ArrowException, ValueError) as e:
+        logger.warning("Cannot snapshot as Parquet (%s); writing CSV instead", e)
+        # Drop the older (or partially written) Parquet snapshot so it cannot
+        # be loaded in place of this one
+        path.unlink(missing_ok=True)
+        _save_csv(df, csv_path)
+        return csv_path
+    return path
+
+
+def _load_snapshot(csv_path: Path) -> tuple[pd.DataFrame, Path]:
+    """Load the latest result saved next to ``csv_path``.
+
+    Reads the Parquet snapshot of an intermediate step if there is one,
+    otherwise the CSV.  Returns the frame and the path it was read from.
+    """
+    path = _snapshot_path(csv_path)
+    if path.exists():
+        return pd.read_parquet(path, engine="pyarrow"), path
+    if not csv_path.exists():
+        raise FileNotFoundError(f"No snapshot at {path} or {csv_path}")
+    return pd.read_csv(csv_path), csv_path
+
+
 def run_pipeline(
     input_csv: Path | None = None,
     skip_geocoding: bool = False,
@@ -75,7 +108,7 @@ def run_pipeline(
 
     # ── Resolve paths ─────────────────────────────────────────────────
 
-    root = _find_project_root()
+    root = _PROJECT_ROOT
 
     if input_csv is None:
         input_csv = root / "vf-ghana.csv"
@@ -108,8 +141,8 @@ def run_pipeline(
         len(df),
     )
 
-    _save_csv(df, output_csv)
-    logger.info("Saved step 1 output (%d rows) to %s", len(df), output_csv)
+    snapshot = _save_snapshot(df, output_csv)
+    logger.info("Saved step 1 output (%d rows) to %s", len(df), snapshot)
 
 
     # ── Step 2: Address Extraction ─────────────────────────────────
@@ -123,8 +156,8 @@ def run_pipeline(
         time.time() - step_start,
     )
 
-    _save_csv(df, output_csv)
-    logger.info("Saved step 2 output (%d rows) to %s", len(df), output_csv)
+    snapshot = _save_snapshot(df, output_csv)
+    logger.info("Saved step 2 output (%d rows) to %s", len(df), snapshot)
 
 
     # ── Step 3: Geocoding (Google) ──────────────────────────────────
@@ -132,17 +165,17 @@ def run_pipeline(
     if skip_geocoding:
         logger.info("Skipping step 3 (geocoding) as requested")
     else:
-        from oasis.cleaning.geocoding import run_geocoding
+        from oasis.cleaning.geocoding import default_checkpoint_path, run_geocoding
 
         step_start = time.time()
-        df = run_geocoding(df)
+        df = run_geocoding(df, checkpoint_path=default_checkpoint_path(output_csv))
         logger.info(
             "Step 3 (geocoding) completed in %.1fs",
             time.time() - step_start,
         )
 
-        _save_csv(df, output_csv)
-        logger.info("Saved step 3 output (%d rows) to %s", len(df), output_csv)
+        snapshot = _save_snapshot(df, output_csv)
+        logger.info("Saved step 3 output (%d rows) to %s", len(df), snapshot)
 
 
     # ── Step 4: Free-form Field Cleaning ──────────────────────────────
@@ -156,8 +189,8 @@ def run_pipeline(
         time.time() - step_start,
     )
 
-    _save_csv(df, output_csv)
-    logger.info("Saved step 4 output (%d rows) to %s", len(df), output_csv)
+    snapshot = _save_snapshot(df, output_csv)
+    logger.info("Saved step 4 output (%d rows) to %s", len(df), snapshot)
 
 
     # ── Step 5: Anomaly Detection ──────────────────────────────────
@@ -173,6 +206,8 @@ def run_pipeline(
 
     _save_csv(df, output_csv)
     logger.info("Saved step 5 output (%d rows) to %s", len(df), output_csv)
+    # The final CSV supersedes the intermediate snapshot
+    _snapshot_path(output_csv).unlink(missing_ok=True)
 
     elapsed = time.time() - pipeline_start
     logger.info(
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
 import pandas as pd
+import pyarrow as pa
 
 from oasis.config import logger
 from oasis.core.datasets import DatasetDefinition
@@ -105,12 +106,14 @@ class QueryResult:
 
     Attributes:
         dataframe: The query result as a pandas DataFrame
+        table: The query result as a pyarrow Table (Arrow execution path only)
         row_count: Total number of rows returned
         truncated: Whether the result was truncated
         error: Error message if the query failed, None otherwise
     """
 
     dataframe: pd.DataFrame | None = None
+    table: pa.Table | None = None
     row_count: int = 0
     truncated: bool = False
     error: str | None = None
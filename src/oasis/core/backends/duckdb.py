@@ -5,19 +5,29 @@ protocol for executing queries against local DuckDB databases.
 """
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import duckdb
+import pandas as pd
 
 from oasis.config import get_default_database_path
 from oasis.core.backends.base import (
     ConnectionError,
+    QueryExecutionError,
     QueryResult,
     TableNotFoundError,
     sanitize_error_message,
 )
 from oasis.core.datasets import DatasetDefinition
 
+# DuckDB produces results in vectors of this many rows
+DUCKDB_VECTOR_SIZE = 2048
+
+# Rows per Arrow record batch / DataFrame chunk when streaming results
+# out of DuckDB (60 DuckDB vectors)
+ARROW_BATCH_ROWS = 122_880
+
 
 class DuckDBBackend:
     """Backend for executing queries against local DuckDB databases.
@@ -150,8 +160,6 @@ class DuckDBBackend:
                 df = conn.execute(sql).df()
 
                 if df.empty:
-                    import pandas as pd
-
                     return QueryResult(
                         dataframe=pd.DataFrame(),
                         row_count=0,
@@ -177,6 +185,114 @@ class DuckDBBackend:
                 error=sanitize_error_message(e, self.name),
             )
 
+    def execute_query_arrow(
+        self,
+        sql: str,
+        dataset: DatasetDefinition,
+        batch_rows: int = ARROW_BATCH_ROWS,
+    ) -> QueryResult:
+        """Execute a SQL query and return the result as an Arrow table.
+
+        Skips pandas materialization entirely: DuckDB streams its result
+        as Arrow record batches, which are assembled into a table without
+        converting values to Python objects. Multi-batch results are
+        combined into a single chunk per column.
+
+        Args:
+            sql: SQL query string
+            dataset: The dataset definition
+            batch_rows: Rows per record batch fetched from DuckDB
+
+        Returns:
+            QueryResult with the query output in ``table`` (``dataframe``
+            is left as None)
+        """
+        try:
+            conn = self._connect(dataset)
+            try:
+                cursor = conn.execute(sql)
+                # to_arrow_reader() supersedes fetch_record_batch() in newer DuckDB
+                to_reader = getattr(cursor, "to_arrow_reader", None)
+                if to_reader is None:
+                    to_reader = cursor.fetch_record_batch
+                table = to_reader(batch_rows).read_all()
+                if table.num_rows and any(
+                    col.num_chunks > 1 for col in table.columns
+                ):
+                    # One contiguous chunk per column: fragmented tables are
+                    # much slower to scan when handed back to DuckDB, and
+                    # only single-chunk columns convert to NumPy zero-copy
+                    table = table.combine_chunks()
+
+                row_count = table.num_rows
+                return QueryResult(
+                    table=table,
+                    row_count=row_count,
+                    truncated=row_count > 50,
+                )
+            finally:
+                conn.close()
+
+        except ConnectionError:
+            raise
+        except Exception as e:
+            return QueryResult(
+                table=None,
+                error=sanitize_error_message(e, self.name),
+            )
+
+    def iter_query(
+        self,
+        sql: str,
+        dataset: DatasetDefinition,
+        chunk_rows: int = ARROW_BATCH_ROWS,
+    ) -> Iterator[pd.DataFrame]:
+        """Execute a SQL query and yield the result in DataFrame chunks.
+
+        Only one chunk is materialized at a time, so peak memory is bounded
+        by ``chunk_rows`` rather than the full result size. Chunks use the
+        same dtypes as ``execute_query``. The connection stays open until
+        the iterator is exhausted or closed.
+
+        Args:
+            sql: SQL query string
+            dataset: The dataset definition
+            chunk_rows: Approximate rows per chunk, rounded to DuckDB's
+                vector size (2048 rows)
+
+        Yields:
+            Non-empty DataFrames with consecutive slices of the result
+
+        Raises:
+            ConnectionError: If the database cannot be opened
+            QueryExecutionError: If the query fails
+        """
+        vectors_per_chunk = max(1, chunk_rows // DUCKDB_VECTOR_SIZE)
+
+        conn = self._connect(dataset)
+        try:
+            try:
+                cursor = conn.execute(sql)
+            except Exception as e:
+                raise QueryExecutionError(
+                    sanitize_error_message(e, self.name), sql=sql, backend=self.name
+                ) from e
+
+            while True:
+                try:
+                    chunk = cursor.fetch_df_chunk(vectors_per_chunk)
+                except Exception as e:
+                    raise QueryExecutionError(
+                        sanitize_error_message(e, self.name),
+                        sql=sql,
+                        backend=self.name,
+                    ) from e
+                if chunk.empty:
+                    return
+                yield chunk
+        finally:
+            conn.close()
+
     def get_table_list(self, dataset: DatasetDefinition) -> list[str]:
         """Get list of available tables in the dataset.
 
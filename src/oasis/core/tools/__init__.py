@@ -52,6 +52,10 @@ def init_tools() -> None:
     """
     global _tools_initialized
 
+    # Fast path: skip the lock once initialized (re-checked under the lock)
+    if _tools_initialized and ToolRegistry.list_all():
+        return
+
     with _tools_lock:
         # Check if already initialized AND tools are registered
         # (handles case where registry was reset but flag is still True)
@@ -13,14 +13,16 @@ Architecture Note:
     for the protocol; the Python API receives them directly.
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from oasis.core.backends import get_backend
 from oasis.core.datasets import DatasetDefinition, Modality
-from oasis.core.exceptions import QueryError, SecurityError
+from oasis.core.exceptions import QueryError, QueryExecutionError, SecurityError
 from oasis.core.tools.base import ToolInput
 from oasis.core.validation import (
     is_safe_query,
@@ -206,6 +208,82 @@ class ExecuteQueryTool:
 
         return result.dataframe if result.dataframe is not None else pd.DataFrame()
 
+    def invoke_arrow(
+        self, dataset: DatasetDefinition, params: ExecuteQueryInput
+    ) -> pa.Table:
+        """Execute a SQL query with safety validation, returning Arrow.
+
+        Backends without a native Arrow path fall back to converting the
+        pandas result.
+
+        Returns:
+            pa.Table with query results
+
+        Raises:
+            SecurityError: If query violates security constraints
+            QueryError: If query execution fails
+        """
+        backend = get_backend()
+        execute_arrow = getattr(backend, "execute_query_arrow", None)
+        if execute_arrow is None:
+            df = self.invoke(dataset, params)
+            return pa.Table.from_pandas(df, preserve_index=False)
+
+        safe, msg = is_safe_query(params.sql_query)
+        if not safe:
+            raise SecurityError(msg, query=params.sql_query)
+
+        result = execute_arrow(params.sql_query, dataset)
+
+        if not result.success:
+            raise QueryError(result.error or "Unknown error", sql=params.sql_query)
+
+        return result.table if result.table is not None else pa.table({})
+
+    def invoke_iter(
+        self,
+        dataset: DatasetDefinition,
+        params: ExecuteQueryInput,
+        chunk_rows: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Execute a SQL query with safety validation, yielding chunks.
+
+        The query is validated before this method returns; execution
+        starts when the iterator is first advanced. Backends without a
+        streaming path yield their full result as a single chunk.
+
+        Returns:
+            Iterator of pd.DataFrame chunks
+
+        Raises:
+            SecurityError: If query violates security constraints
+            QueryError: If query execution fails (raised while iterating)
+        """
+        safe, msg = is_safe_query(params.sql_query)
+        if not safe:
+            raise SecurityError(msg, query=params.sql_query)
+
+        backend = get_backend()
+        iter_query = getattr(backend, "iter_query", None)
+        if iter_query is None:
+            return self._iter_single(dataset, params)
+
+        return self._iter_chunks(iter_query(params.sql_query, dataset, chunk_rows))
+
+    def _iter_single(
+        self, dataset: DatasetDefinition, params: ExecuteQueryInput
+    ) -> Iterator[pd.DataFrame]:
+        """Run the query on first advance and yield its full result."""
+        yield self.invoke(dataset, params)
+
+    @staticmethod
+    def _iter_chunks(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Re-raise backend execution failures as QueryError."""
+        try:
+            yield from chunks
+        except QueryExecutionError as e:
+            raise QueryError(e.message, sql=e.sql) from e
+
     def is_compatible(self, dataset: DatasetDefinition) -> bool:
         """Check compatibility."""
         if self.supported_datasets and dataset.name not in self.supported_datasets:
@@ -1,6 +1,10 @@
 """Install OASIS skills to AI coding tool directories."""
 
+import contextlib
+import functools
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -9,8 +13,11 @@ from oasis.config import logger
 VALID_TIERS = {"validated", "expert", "community"}
 VALID_CATEGORIES = {"clinical", "system"}
 
+# Upper bound on concurrent copy operations during install
+MAX_INSTALL_WORKERS = 8
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AITool:
     """Configuration for an AI coding tool."""
 
@@ -19,7 +26,7 @@ class AITool:
     skills_dir: str  # e.g., ".claude/skills"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillInfo:
     """Metadata for a bundled skill parsed from SKILL.md frontmatter."""
 
@@ -41,6 +48,7 @@ AI_TOOLS: dict[str, AITool] = {
 }
 
 
+@functools.cache
 def get_skills_source() -> Path:
     """Get path to bundled skills in the package.
 
@@ -76,25 +84,24 @@ def _parse_skill_metadata(skill_dir: Path) -> SkillInfo | None:
     if not skill_md.exists():
         return None
 
-    text = skill_md.read_text(encoding="utf-8")
-
-    # Frontmatter is between the first two "---" lines
-    if not text.startswith("---"):
-        logger.debug(f"No frontmatter in {skill_md}")
-        return None
-
-    end = text.find("---", 3)
-    if end == -1:
-        logger.debug(f"Unclosed frontmatter in {skill_md}")
-        return None
-
-    frontmatter = text[3:end].strip()
+    # Frontmatter is between the first two "---" lines; read only that far
+    # instead of loading the whole skill body
     fields: dict[str, str] = {}
-    for line in frontmatter.splitlines():
-        if ":" not in line:
-            continue
-        key, _, value = line.partition(":")
-        fields[key.strip()] = value.strip()
+    with skill_md.open("r", encoding="utf-8") as f:
+        if f.readline().strip() != "---":
+            logger.debug(f"No frontmatter in {skill_md}")
+            return None
+
+        for line in f:
+            if line.strip() == "---":
+                break
+            if ":" not in line:
+                continue
+            key, _, value = line.partition(":")
+            fields[key.strip()] = value.strip()
+        else:
+            logger.debug(f"Unclosed frontmatter in {skill_md}")
+            return None
 
     required = {"name", "description", "tier", "category"}
     missing = required - fields.keys()
@@ -129,13 +136,7 @@ def get_available_skills(
     Returns:
         Sorted list of matching SkillInfo objects.
     """
-    source = get_skills_source()
-    all_skills: list[SkillInfo] = []
-
-    for skill_dir in _discover_skills(source):
-        info = _parse_skill_metadata(skill_dir)
-        if info is not None:
-            all_skills.append(info)
+    all_skills = list(_discover_all())
 
     # Apply filters (AND logic)
     if names is not None:
@@ -151,6 +152,36 @@ def get_available_skills(
     return sorted(all_skills, key=lambda s: s.name)
 
 
+@functools.lru_cache(maxsize=1)
+def _discover_all() -> tuple[SkillInfo, ...]:
+    """Discover and parse all bundled skills once per process.
+
+    The bundled skills directory does not change at runtime, so the
+    unfiltered result is memoized; ``get_available_skills`` filters it.
+
+    Returns:
+        Tuple of SkillInfo for every bundled skill.
+    """
+    return tuple(_scan_skills(get_skills_source()))
+
+
+def _scan_skills(source: Path) -> list[SkillInfo]:
+    """Discover skills under source and parse each SKILL.md frontmatter.
+
+    Args:
+        source: Root directory to search for skills.
+
+    Returns:
+        List of SkillInfo for every skill with valid frontmatter.
+    """
+    all_skills: list[SkillInfo] = []
+    for skill_dir in _discover_skills(source):
+        info = _parse_skill_metadata(skill_dir)
+        if info is not None:
+            all_skills.append(info)
+    return all_skills
+
+
 def install_skills(
     tools: list[str] | None = None,
     target_dir: Path | None = None,
@@ -215,6 +246,8 @@ def install_skills(
     # Default to claude only for backwards compatibility
     if tools is None:
         tools = ["claude"]
+    # A tool listed twice would install into its directory from two threads
+    tools = list(dict.fromkeys(tools))
 
     # Validate tool names
     unknown_tools = set(tools) - set(AI_TOOLS.keys())
@@ -224,13 +257,13 @@ def install_skills(
             f"Supported tools: {list(AI_TOOLS.keys())}"
         )
 
-    results: dict[str, list[Path]] = {}
-
-    for tool_name in tools:
-        tool = AI_TOOLS[tool_name]
-        target = project_root / tool.skills_dir
-        installed = _install_skills_to_dir(selected, target)
-        results[tool_name] = installed
+    # Each tool writes to its own directory, so tools install in parallel
+    targets = [project_root / AI_TOOLS[tool_name].skills_dir for tool_name in tools]
+    with ThreadPoolExecutor(max_workers=_worker_count(len(tools))) as executor:
+        installed_per_tool = executor.map(
+            lambda target: _install_skills_to_dir(selected, target), targets
+        )
+        results: dict[str, list[Path]] = dict(zip(tools, installed_per_tool))
 
     return results
 
@@ -248,7 +281,9 @@ def _discover_skills(source: Path) -> list[Path]:
     Returns:
         Sorted list of skill directory paths.
     """
-    return sorted(p.parent for p in source.rglob("SKILL.md"))
+    return sorted(
+        Path(root) for root, _dirs, files in os.walk(source) if "SKILL.md" in files
+    )
 
 
 def _install_skills_to_dir(skills: list[SkillInfo], target_dir: Path) -> list[Path]:
@@ -266,22 +301,103 @@ def _install_skills_to_dir(skills: list[SkillInfo], target_dir: Path) -> list[Pa
     """
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    installed = []
+    if not skills:
+        return []
 
+    # Skills with the same directory name (from different categories) flatten
+    # to the same target, so each name's skills install serially, in order,
+    # and the last one wins
+    by_name: dict[str, list[SkillInfo]] = {}
     for skill in skills:
-        # Flatten: use only the skill directory name, not the full subpath
-        target_skill_dir = target_dir / skill.path.name
+        by_name.setdefault(skill.path.name, []).append(skill)
+
+    def install_group(group: list[SkillInfo]) -> list[Path]:
+        return [_install_skill(skill, target_dir) for skill in group]
 
-        # Remove existing installation of this skill
-        if target_skill_dir.exists():
-            logger.debug(f"Removing existing skill at {target_skill_dir}")
-            shutil.rmtree(target_skill_dir)
+    # Copies are I/O-bound, so a thread pool overlaps the distinct names
+    with ThreadPoolExecutor(max_workers=_worker_count(len(by_name))) as executor:
+        list(executor.map(install_group, by_name.values()))
+    return [target_dir / skill.path.name for skill in skills]
+
+
+def _install_skill(skill: SkillInfo, target_dir: Path) -> Path:
+    """Copy a single skill into a target directory, replacing any old copy.
+
+    Args:
+        skill: Skill to install.
+        target_dir: Directory to install the skill into.
+
+    Returns:
+        Path where the skill was installed.
+    """
+    # Flatten: use only the skill directory name, not the full subpath
+    target_skill_dir = target_dir / skill.path.name
 
-        logger.debug(f"Copying skill from {skill.path} to {target_skill_dir}")
-        shutil.copytree(skill.path, target_skill_dir)
-        installed.append(target_skill_dir)
+    # Remove existing installation of this skill
+    if target_skill_dir.exists():
+        logger.debug(f"Removing existing skill at {target_skill_dir}")
+        shutil.rmtree(target_skill_dir)
 
-    return installed
+    logger.debug(f"Copying skill from {skill.path} to {target_skill_dir}")
+    shutil.copytree(skill.path, target_skill_dir, copy_function=_fast_copy)
+    return target_skill_dir
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """Copy a skill file in-kernel, falling back to ``shutil.copy2``.
+
+    Installed skills are meant to be edited by users, so every file is a
+    real copy (or a copy-on-write reflink where the filesystem supports
+    it), never a hardlink that would alias the packaged original.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+
+    Returns:
+        The destination path, as expected by ``shutil.copytree``.
+    """
+    try:
+        _copy_file_kernel(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _copy_file_kernel(src: str, dst: str) -> None:
+    """Copy a file in-kernel with ``os.copy_file_range``.
+
+    Lets the kernel (and filesystems that support it, e.g. btrfs/XFS
+    reflinks) copy the data without a userspace buffer. Raises OSError
+    when ``copy_file_range`` is unavailable or unsupported so the caller
+    can fall back to ``shutil.copy2``.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        raise OSError("os.copy_file_range is not available on this platform")
+
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.unlink(dst)
+        raise
+    shutil.copystat(src, dst)
+
+
+def _worker_count(num_tasks: int) -> int:
+    """Return the thread pool size for a given number of copy tasks."""
+    return max(1, min(MAX_INSTALL_WORKERS, num_tasks))
 
 
 def get_installed_skills(
@@ -308,9 +424,13 @@ def get_installed_skills(
     if not skills_dir.exists():
         return []
 
-    return [
-        d.name for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()
-    ]
+    # DirEntry.is_dir() uses the cached dirent type, avoiding a stat per entry
+    with os.scandir(skills_dir) as entries:
+        return [
+            entry.name
+            for entry in entries
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        ]
 
 
 def get_all_installed_skills(
@@ -13,9 +13,14 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 
-from oasis.core.backends.base import ConnectionError, TableNotFoundError
+from oasis.core.backends.base import (
+    ConnectionError,
+    QueryExecutionError,
+    TableNotFoundError,
+)
 from oasis.core.backends.duckdb import DuckDBBackend
 from oasis.core.datasets import DatasetDefinition, Modality
 
@@ -472,6 +477,110 @@ class TestDuckDBEdgeCases:
         assert result.error is not None
 
 
+class TestDuckDBArrowQueryExecution:
+    """Test Arrow-native query execution."""
+
+    def test_returns_arrow_table(self, test_dataset, temp_db):
+        """Test the result is returned as a pyarrow Table."""
+        import pyarrow as pa
+
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        result = backend.execute_query_arrow(
+            "SELECT * FROM facilities ORDER BY pk_unique_id", test_dataset
+        )
+
+        assert result.success is True
+        assert result.dataframe is None
+        assert isinstance(result.table, pa.Table)
+        assert result.row_count == 3
+        assert result.table.column("number_beds").to_pylist() == [200, 1600, 420]
+
+    def test_small_batches_are_combined(self, test_dataset, temp_db):
+        """Test results spanning several record batches keep every row."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        result = backend.execute_query_arrow(
+            "SELECT * FROM range(5000)", test_dataset, batch_rows=1024
+        )
+
+        assert result.success is True
+        assert result.row_count == 5000
+        assert result.truncated is True
+        assert all(col.num_chunks == 1 for col in result.table.columns)
+
+    def test_empty_result(self, test_dataset, temp_db):
+        """Test an empty result keeps the schema."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        result = backend.execute_query_arrow(
+            "SELECT * FROM facilities WHERE pk_unique_id = 999", test_dataset
+        )
+
+        assert result.success is True
+        assert result.row_count == 0
+        assert "name" in result.table.column_names
+
+    def test_query_error(self, test_dataset, temp_db):
+        """Test query errors are reported on the result."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        result = backend.execute_query_arrow(
+            "SELECT * FROM nonexistent_table", test_dataset
+        )
+
+        assert result.success is False
+        assert result.table is None
+
+
+class TestDuckDBChunkedQueryExecution:
+    """Test chunked (streaming) query execution."""
+
+    def test_chunks_cover_full_result(self, test_dataset, temp_db):
+        """Test chunks are bounded in size and concatenate to the full result."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        chunks = list(
+            backend.iter_query(
+                "SELECT range AS n FROM range(10000)", test_dataset, chunk_rows=4096
+            )
+        )
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 4096 for chunk in chunks)
+        combined = pd.concat(chunks, ignore_index=True)
+        assert combined["n"].tolist() == list(range(10000))
+
+    def test_dtypes_match_execute_query(self, test_dataset, temp_db):
+        """Test chunks use the same dtypes as execute_query."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+        sql = "SELECT * FROM facilities"
+
+        (chunk,) = backend.iter_query(sql, test_dataset)
+        full = backend.execute_query(sql, test_dataset).dataframe
+
+        assert chunk.dtypes.equals(full.dtypes)
+
+    def test_empty_result_yields_nothing(self, test_dataset, temp_db):
+        """Test an empty result produces no chunks."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        chunks = list(
+            backend.iter_query(
+                "SELECT * FROM facilities WHERE pk_unique_id = 999", test_dataset
+            )
+        )
+
+        assert chunks == []
+
+    def test_query_error_raises(self, test_dataset, temp_db):
+        """Test query errors are raised as QueryExecutionError."""
+        backend = DuckDBBackend(db_path_override=temp_db)
+
+        with pytest.raises(QueryExecutionError):
+            list(backend.iter_query("SELECT * FROM nonexistent_table", test_dataset))
+
+
 # ----------------------------------------------------------------
 # Schema-qualified operations
 # ----------------------------------------------------------------
@@ -0,0 +1,38 @@
+"""Tests for heuristic geocoding query building (address_extraction)."""
+
+import pandas as pd
+import pytest
+
+from oasis.cleaning import address_extraction
+
+
+@pytest.fixture
+def addresses():
+    """Facilities whose fields contain non-ASCII whitespace."""
+    return pd.DataFrame(
+        {
+            "name": ["\x1cKorle Bu\xa0", "Ridge", None, "A B"],
+            "address_city": ["Accra\xa0", "Accra", "Kumasi", None],
+            "address_line1": [
+                "12\xa0\xa0Main St (near x)",
+                "Near\xa0Mall, 5 Oxford St",
+                "Osu\x1cRd　",
+                " Ring Rd ",
+            ],
+        }
+    )
+
+
+def test_vectorized_path_matches_row_path(addresses, monkeypatch):
+    """Test the column-wise builder treats whitespace like the per-row one."""
+    row_wise = address_extraction._build_geo_queries(addresses)
+    monkeypatch.setattr(address_extraction, "_VECTORIZE_MIN_ROWS", 0)
+    column_wise = address_extraction._build_geo_queries(addresses)
+
+    assert column_wise == row_wise
+    assert row_wise[0] == [
+        "Korle Bu",
+        "Korle Bu, Accra, Ghana",
+        "12 Main St, Accra, Ghana",
+    ]
+    assert row_wise[2] == ["Osu Rd, Kumasi, Ghana"]
@@ -10,6 +10,7 @@ of formatted strings. Tools raise exceptions for errors.
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from oasis.api import (
@@ -17,6 +18,8 @@ from oasis.api import (
     OASISError,
     QueryError,
     execute_query,
+    execute_query_arrow,
+    execute_query_iter,
     get_active_dataset,
     get_schema,
     get_table_info,
@@ -199,6 +202,109 @@ class TestTabularDataAPI:
         with pytest.raises(SecurityError):
             execute_query("SELECT * FROM vf.facilities WHERE 1=1")
 
+    @patch(TABULAR_BACKEND_PATCH)
+    @patch("oasis.api.DatasetRegistry.get_active")
+    def test_execute_query_arrow_success(
+        self, mock_get_active, mock_get_backend, mock_tabular_dataset
+    ):
+        """Test execute_query_arrow returns a pyarrow Table."""
+        mock_get_active.return_value = mock_tabular_dataset
+        mock_backend = MagicMock()
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.table = pa.table({"count": [100]})
+        mock_backend.execute_query_arrow.return_value = mock_result
+        mock_get_backend.return_value = mock_backend
+
+        result = execute_query_arrow("SELECT COUNT(*) FROM vf.facilities")
+
+        assert isinstance(result, pa.Table)
+        assert result.column("count").to_pylist() == [100]
+        mock_backend.execute_query.assert_not_called()
+
+    @patch(TABULAR_BACKEND_PATCH)
+    @patch("oasis.api.DatasetRegistry.get_active")
+    def test_execute_query_arrow_unsafe_raises_error(
+        self, mock_get_active, mock_get_backend, mock_tabular_dataset
+    ):
+        """Test execute_query_arrow applies the same SQL validation."""
+        mock_get_active.return_value = mock_tabular_dataset
+        with pytest.raises(SecurityError):
+            execute_query_arrow("DROP TABLE facilities")
+
+    @patch(TABULAR_BACKEND_PATCH)
+    @patch("oasis.api.DatasetRegistry.get_active")
+    def test_execute_query_iter_yields_chunks(
+        self, mock_get_active, mock_get_backend, mock_tabular_dataset
+    ):
+        """Test execute_query_iter yields the backend's DataFrame chunks."""
+        mock_get_active.return_value = mock_tabular_dataset
+        mock_backend = MagicMock()
+        chunks = [pd.DataFrame({"n": [1, 2]}), pd.DataFrame({"n": [3]})]
+        mock_backend.iter_query.return_value = iter(chunks)
+        mock_get_backend.return_value = mock_backend
+
+        result = list(execute_query_iter("SELECT n FROM vf.facilities", chunk_rows=2))
+
+        assert [len(chunk) for chunk in result] == [2, 1]
+        assert mock_backend.iter_query.call_args.args[2] == 2
+
+    @patch(TABULAR_BACKEND_PATCH)
+    @patch("oasis.api.DatasetRegistry.get_active")
+    def test_execute_query_iter_without_streaming_backend(
+        self, mock_get_active, mock_get_backend, mock_tabular_dataset
+    ):
+        """Test the single-chunk fallback runs lazily and fails while iterating."""
+        mock_get_active.return_value = mock_tabular_dataset
+        mock_backend = MagicMock(spec=["execute_query"])
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.dataframe = pd.DataFrame({"n": [1, 2, 3]})
+        mock_backend.execute_query.return_value = mock_result
+        mock_get_backend.return_value = mock_backend
+
+        result = execute_query_iter("SELECT n FROM vf.facilities")
+        mock_backend.execute_query.assert_not_called()
+        assert [len(chunk) for chunk in result] == [3]
+
+        mock_result.success = False
+        mock_result.error = "boom"
+        result = execute_query_iter("SELECT n FROM vf.facilities")
+        with pytest.raises(QueryError):
+            next(result)
+
+    @patch(TABULAR_BACKEND_PATCH)
+    @patch("oasis.api.DatasetRegistry.get_active")
+    def test_execute_query_iter_validates_eagerly(
+        self, mock_get_active, mock_get_backend, mock_tabular_dataset
+    ):
+        """Test unsafe SQL is rejected before iteration starts."""
+        mock_get_active.return_value = mock_tabular_dataset
+        with pytest.raises(SecurityError):
+            execute_query_iter("DROP TABLE facilities")
+
+
+class TestToolLookup:
+    """Test cached tool lookup used by the API functions."""
+
+    def test_get_tool_is_cached(self):
+        """Test repeated lookups reuse the registered tool instance."""
+        from oasis.api import _get_tool
+        from oasis.core.tools import ToolRegistry
+
+        _get_tool.cache_clear()
+        tool = _get_tool("execute_query")
+        assert tool is ToolRegistry.get("execute_query")
+        assert _get_tool("execute_query") is tool
+        assert _get_tool.cache_info().hits == 1
+
+    def test_get_tool_unknown_raises(self):
+        """Test looking up an unregistered tool raises OASISError."""
+        from oasis.api import _get_tool
+
+        with pytest.raises(OASISError):
+            _get_tool("no_such_tool")
+
 
 class TestExceptionHierarchy:
     """Test the exception class hierarchy."""
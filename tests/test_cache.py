@@ -0,0 +1,30 @@
+"""Tests for the shared two-tier cache (cleaning._cache)."""
+
+import logging
+
+from oasis.cleaning._cache import SQLiteCache
+
+
+class TextCache(SQLiteCache[str]):
+    table = "text"
+    columns = ("value TEXT",)
+    label = "Text"
+
+    def _decode(self, row):
+        return row[0]
+
+
+def test_read_error_is_a_miss(tmp_path, caplog):
+    """Test a failing SELECT falls back to the in-memory tier."""
+    cache = TextCache(tmp_path / "cache.sqlite")
+    cache._put_many([("a", "1", ("1",))])
+    cache._memory.clear()
+    cache._put_many([("b", "2", ("2",))])
+    cache._conn.execute("DROP TABLE text")
+
+    with caplog.at_level(logging.WARNING):
+        assert cache._get_many(["a", "b"]) == [None, "2"]
+        assert cache._get_many(["a"]) == [None]
+
+    assert caplog.text.count("Could not read Text cache entries") == 1
+    cache.close()
@@ -0,0 +1,88 @@
+"""Tests for geocoding checkpoints (geocoding)."""
+
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from oasis.cleaning import geocoding
+
+RESPONSES = {
+    "Flaky Clinic, Accra": None,  # request failed, e.g. network error
+    "Missing Clinic, Accra": {"status": "ZERO_RESULTS"},
+    "Accra, Ghana": {
+        "status": "OK",
+        "results": [
+            {
+                "geometry": {
+                    "location": {"lat": 5.6, "lng": -0.2},
+                    "location_type": "APPROXIMATE",
+                }
+            }
+        ],
+    },
+    "Ridge Hospital, Accra": {
+        "status": "OK",
+        "results": [
+            {
+                "geometry": {
+                    "location": {"lat": 5.56, "lng": -0.19},
+                    "location_type": "ROOFTOP",
+                }
+            }
+        ],
+    },
+}
+
+
+@pytest.fixture
+def checkpointed(tmp_path):
+    """Geocode some facilities and return the rows left in the checkpoint."""
+
+    def run(query_lists):
+        df = pd.DataFrame({"geo_queries": [json.dumps(q) for q in query_lists]})
+        path = tmp_path / "checkpoint"
+        with (
+            patch.object(geocoding, "_get_api_key", return_value="key"),
+            patch.object(
+                geocoding,
+                "_request_geocode",
+                side_effect=lambda query, api_key: RESPONSES[query],
+            ),
+            patch.object(geocoding._Checkpoint, "remove"),
+        ):
+            geocoding.run_geocoding(df, use_cache=False, checkpoint_path=path)
+        return geocoding._Checkpoint(path).load(df["geo_queries"].tolist())
+
+    return run
+
+
+def test_checkpoint_skips_results_after_transient_failure(checkpointed):
+    """Test a fallback chosen because a candidate failed is retried later."""
+    restored = checkpointed(
+        [
+            ["Flaky Clinic, Accra", "Accra, Ghana"],
+            ["Flaky Clinic, Accra", "Ridge Hospital, Accra"],
+            ["Flaky Clinic, Accra"],
+        ]
+    )
+
+    assert restored == {}
+
+
+def test_checkpoint_keeps_final_results(checkpointed):
+    """Test results backed by definitive answers are checkpointed."""
+    restored = checkpointed(
+        [
+            ["Missing Clinic, Accra", "Accra, Ghana"],
+            ["Ridge Hospital, Accra", "Flaky Clinic, Accra"],
+            ["Missing Clinic, Accra"],
+        ]
+    )
+
+    assert {pos: result[4] for pos, result in restored.items()} == {
+        0: "approximate",
+        1: "ok",
+        2: "error",
+    }
@@ -0,0 +1,52 @@
+"""Tests for the sentence-transformer backend selection (normalization)."""
+
+import importlib.util
+import sys
+import types
+
+import pytest
+
+from oasis.cleaning import normalization
+
+
+class FakeSentenceTransformer:
+    """Records its backend; the ONNX backend fails like a missing extra."""
+
+    device = types.SimpleNamespace(type="cpu")
+
+    def __init__(self, model_name, backend="torch"):
+        if backend == "onnx":
+            raise Exception("Using the ONNX backend requires installing Optimum")
+        self.backend = backend
+
+
+@pytest.fixture
+def fake_sentence_transformers(monkeypatch):
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    normalization._get_model.cache_clear()
+    yield
+    normalization._get_model.cache_clear()
+
+
+def test_onnx_falls_back_when_extra_missing(
+    fake_sentence_transformers, monkeypatch, caplog
+):
+    """Test a missing optimum/onnxruntime selects torch without trying ONNX."""
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "optimum" else find_spec(name, *args),
+    )
+
+    assert normalization._get_model("onnx").backend == "torch"
+    assert "not installed" in caplog.text
+
+
+def test_onnx_falls_back_when_load_fails(fake_sentence_transformers, monkeypatch):
+    """Test a bare Exception from the ONNX load selects torch."""
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: object())
+
+    assert normalization._get_model("onnx").backend == "torch"
@@ -0,0 +1,31 @@
+"""Tests for the cleaning pipeline's intermediate snapshots."""
+
+import pandas as pd
+
+from oasis.cleaning.pipeline import _load_snapshot, _save_snapshot
+
+
+def test_snapshot_round_trips_through_parquet(tmp_path):
+    """Test list columns survive a Parquet snapshot."""
+    csv_path = tmp_path / "clean.csv"
+    df = pd.DataFrame({"name": ["A", "B"], "specialties": [["x"], ["y", "z"]]})
+
+    written = _save_snapshot(df, csv_path)
+    loaded, path = _load_snapshot(csv_path)
+
+    assert written == path == tmp_path / "clean.parquet"
+    assert [list(v) for v in loaded["specialties"]] == [["x"], ["y", "z"]]
+
+
+def test_csv_fallback_removes_stale_parquet(tmp_path):
+    """Test a CSV snapshot is not shadowed by an older Parquet one."""
+    csv_path = tmp_path / "clean.csv"
+    _save_snapshot(pd.DataFrame({"step": [1, 1]}), csv_path)
+
+    # Mixed int/str cannot be converted to Arrow
+    written = _save_snapshot(pd.DataFrame({"step": [2, "two"]}), csv_path)
+    loaded, path = _load_snapshot(csv_path)
+
+    assert written == path == csv_path
+    assert not (tmp_path / "clean.parquet").exists()
+    assert loaded["step"].astype(str).tolist() == ["2", "two"]